@@ -2,10 +2,8 @@
 
 This module provides CLI support for automated builds and CI/CD integration.
 """
-import argparse
 import sys
 from pathlib import Path
-from core import LibraryProcessor
 from version import __version__
 
 
@@ -15,6 +13,8 @@ def parse_args():
     Returns:
         argparse.Namespace: Parsed arguments
     """
+    import argparse
+    
     parser = argparse.ArgumentParser(
         prog='BRLibToHelp',
         description='Generate CHM help files from B&R Automation Studio libraries',
@@ -61,7 +61,7 @@ Exit Codes:
     )
     
     parser.add_argument(
-        '--version',
+        '--version', '-V',
         action='version',
         version=f'%(prog)s {__version__}'
     )
@@ -75,6 +75,11 @@ def main():
     Returns:
         int: Exit code (0=success, >0=error)
     """
+    # Fast path: answer --version without building the argument parser
+    if len(sys.argv) == 2 and sys.argv[1] in ('--version', '-V'):
+        print(f"BRLibToHelp {__version__}")
+        return 0
+    
     args = parse_args()
     
     # Validate arguments
@@ -105,13 +110,8 @@ def main():
         print(f"   Keep sources: {'Yes' if args.keep_sources else 'No'}")
         print()
     
-    # Validate library path exists
-    if not lib_path.exists():
-        print(f"[ERROR] Library folder not found", file=sys.stderr)
-        print(f"   Path: {lib_path}", file=sys.stderr)
-        return 2
-    
     # Validate or create output path
+    # (library folder itself is validated once by LibraryProcessor.validate_inputs)
     if args.output:
         # User-specified output must exist
         if not out_path.exists():
@@ -120,23 +120,32 @@ def main():
             print(f"   Tip: Create the output directory before running", file=sys.stderr)
             return 3
     else:
+        # Library folder must exist before creating <library>/Help/ (mkdir would create it otherwise)
+        if not lib_path.is_dir():
+            print(f"[ERROR] Library folder not found", file=sys.stderr)
+            print(f"   Path: {lib_path}", file=sys.stderr)
+            return 2
+        
         # Create Help folder if it doesn't exist
-        if not out_path.exists():
-            try:
-                out_path.mkdir(parents=True)
-                if args.verbose:
-                    print(f"[INFO] Created Help folder: {out_path}")
-            except Exception as e:
-                print(f"[ERROR] Could not create Help folder", file=sys.stderr)
-                print(f"   Path: {out_path}", file=sys.stderr)
-                print(f"   Error: {str(e)}", file=sys.stderr)
-                return 3
+        try:
+            created = not out_path.is_dir()
+            out_path.mkdir(parents=True, exist_ok=True)
+            if created and args.verbose:
+                print(f"[INFO] Created Help folder: {out_path}")
+        except OSError as e:
+            print(f"[ERROR] Could not create Help folder", file=sys.stderr)
+            print(f"   Path: {out_path}", file=sys.stderr)
+            print(f"   Error: {str(e)}", file=sys.stderr)
+            return 3
+    
+    # Lazy import: only load parsers and CHM generator once arguments are valid
+    from core import LibraryProcessor, ErrorKind
     
     # Create processor
     # When using Help folder, never keep sources (keep_sources forced to False)
     processor = LibraryProcessor(
-        library_path=str(lib_path),
-        output_path=str(out_path),
+        library_path=lib_path,
+        output_path=out_path,
         keep_sources=args.keep_sources if not use_help_folder else False,
         use_help_folder=use_help_folder
     )
@@ -145,57 +154,64 @@ def main():
     if args.verbose:
         print("[INFO] Parsing library files...")
     
-    result = processor.process()
+    try:
+        result = processor.process()
+    except Exception as e:
+        # process() only catches the expected failures; report anything else instead of a traceback
+        print(f"[ERROR] Unexpected error: {str(e)}", file=sys.stderr)
+        return 4
     
     # Handle errors
     if not result['success']:
         print(f"[ERROR] {result['error']}", file=sys.stderr)
         
-        # Determine appropriate exit code based on error message
-        error_lower = result['error'].lower()
-        if 'library folder' in error_lower or 'not found' in error_lower:
-            return 2
-        elif 'output folder' in error_lower or 'permission' in error_lower:
-            return 3
-        else:
-            return 4
+        # Determine appropriate exit code based on error kind
+        exit_codes = {
+            ErrorKind.LIB_ERROR: 2,
+            ErrorKind.OUT_ERROR: 3,
+        }
+        return exit_codes.get(result['error_kind'], 4)
     
     # Success!
     library = result['library']
-    stats = result['stats']
     chm_path = result['chm_path']
     
     if args.verbose:
-        print()
-        print("[SUCCESS] CHM help file generated successfully!")
-        print()
-        print(f"[INFO] Output: {chm_path}")
-        print(f"[INFO] Library: {library.name} v{library.version}")
+        # Build the whole summary first and write it in one call
+        lines = [
+            "",
+            "[SUCCESS] CHM help file generated successfully!",
+            "",
+            f"[INFO] Output: {chm_path}",
+            f"[INFO] Library: {library.name} v{library.version}",
+        ]
         if library.type:
-            print(f"   Type: {library.type}")
-        print()
-        print("[INFO] Documentation Statistics:")
-        print(f"   Functions: {stats['functions']}")
-        print(f"   Function Blocks: {stats['function_blocks']}")
-        print(f"   Structures: {stats['structures']}")
-        print(f"   Enumerations: {stats['enumerations']}")
-        print(f"   Constants: {stats['constants']}")
+            lines.append(f"   Type: {library.type}")
+        lines += [
+            "",
+            "[INFO] Documentation Statistics:",
+            f"   Functions: {len(library.functions)}",
+            f"   Function Blocks: {len(library.function_blocks)}",
+            f"   Structures: {len(library.structures)}",
+            f"   Enumerations: {len(library.enumerations)}",
+            f"   Constants: {len(library.constants)}",
+        ]
         
         if use_help_folder:
-            print()
-            print(f"[INFO] CHM placed in library Help folder (ready for F1 integration)")
+            lines += ["", "[INFO] CHM placed in library Help folder (ready for F1 integration)"]
         elif not args.keep_sources:
-            print()
-            print("[INFO] HTML source files deleted (use -k to keep them)")
+            lines += ["", "[INFO] HTML source files deleted (use -k to keep them)"]
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     else:
         # Concise output for scripts
         print(f"[OK] CHM generated: {chm_path}")
         print(f"   {library.name} v{library.version} - "
-              f"{stats['functions']} functions, "
-              f"{stats['function_blocks']} FBs, "
-              f"{stats['structures']} structs, "
-              f"{stats['enumerations']} enums, "
-              f"{stats['constants']} constants")
+              f"{len(library.functions)} functions, "
+              f"{len(library.function_blocks)} FBs, "
+              f"{len(library.structures)} structs, "
+              f"{len(library.enumerations)} enums, "
+              f"{len(library.constants)} constants")
     
     return 0
 
@@ -3,12 +3,55 @@
 This module provides a standalone processor that can be used by both
 GUI and CLI interfaces to generate CHM documentation from B&R libraries.
 """
+import os
+from enum import IntEnum
 from pathlib import Path
-from typing import Dict, List, Optional
-from parser import LibraryDeclarationFileParser, TypeFileParser, VarFileParser, LibraryFileParser
-from selectLibrary import SelectLibrary, is_valid_library
-from libraryToChm import LibraryDeclarationToChm
-from datatypes import Library, Structure, Enumeration, VarConstant
+from typing import Callable, Dict, List, Optional, Union
+
+
+class ErrorKind(IntEnum):
+    """Category of a processing failure, reported in the result of LibraryProcessor.process().
+    
+    Attributes:
+        LIB_ERROR: Library folder missing, unreadable or not a valid B&R library
+        OUT_ERROR: Output folder missing or not writable
+        PARSE_FAILED: Library declaration file (.fun) could not be parsed
+        CHM_FAILED: HTML or CHM generation failed
+    """
+    LIB_ERROR = 1
+    OUT_ERROR = 2
+    PARSE_FAILED = 3
+    CHM_FAILED = 4
+
+
+# Parser instances reused for every parsed file
+_parsers: Dict[str, object] = {}
+
+
+def _parse_typ_file(file_path: str) -> tuple[list, list]:
+    """Parse a single .typ file with the shared TypeFileParser.
+    
+    Returns:
+        tuple: (structures, enumerations)
+    """
+    parser = _parsers.get('typ')
+    if parser is None:
+        from parser import TypeFileParser
+        parser = _parsers['typ'] = TypeFileParser()
+    return parser.parse_typ_file(file_path=file_path)
+
+
+def _parse_var_file(file_path: str) -> list:
+    """Parse a single .var file with the shared VarFileParser.
+    
+    Returns:
+        list: Constants declared in the file
+    """
+    parser = _parsers.get('var')
+    if parser is None:
+        from parser import VarFileParser
+        parser = _parsers['var'] = VarFileParser()
+    return parser.parse_var_file(file_path=file_path)
 
 
 class LibraryProcessor:
@@ -23,40 +66,117 @@ class LibraryProcessor:
         keep_sources: Whether to keep HTML source files after CHM generation
     """
     
-    def __init__(self, library_path: str, output_path: str, keep_sources: bool = True, use_help_folder: bool = False):
+    def __init__(self, library_path: Union[str, Path], output_path: Union[str, Path], keep_sources: bool = True, use_help_folder: bool = False):
         """Initialize the library processor.
         
+        String paths are resolved here. Path objects are taken as already
+        resolved by the caller (CLI, GUI) and used as given.
+        
         Args:
             library_path: Path to the library folder containing .fun, .typ, .var files
             output_path: Path where the CHM file will be generated
             keep_sources: If True, keep HTML sources; if False, delete them after CHM generation
             use_help_folder: If True, places CHM directly in Help folder (no subdirectories)
         """
-        self.library_path = Path(library_path).resolve()
-        self.output_path = Path(output_path).resolve()
+        self.library_path = library_path if isinstance(library_path, Path) else Path(library_path).resolve()
+        self._lib_str = str(self.library_path)
+        self.output_path = output_path if isinstance(output_path, Path) else Path(output_path).resolve()
         self.keep_sources = keep_sources
         self.use_help_folder = use_help_folder
         
-    def validate_inputs(self) -> tuple[bool, Optional[str]]:
+    def validate_inputs(self) -> tuple[bool, Optional[str], Optional[ErrorKind]]:
         """Validate library and output paths.
         
         Returns:
-            tuple: (is_valid, error_message)
+            tuple: (is_valid, error_message, error_kind)
         """
-        # Check library path exists
-        if not self.library_path.exists():
-            return False, f"Library folder not found: {self.library_path}"
+        # Check library path exists (single stat, reused by is_valid_library)
+        try:
+            library_stat = os.stat(self.library_path)
+        except FileNotFoundError:
+            return False, f"Library folder not found: {self.library_path}", ErrorKind.LIB_ERROR
+        except OSError as e:
+            return False, f"Cannot access library folder: {str(e)}", ErrorKind.LIB_ERROR
         
         # Check output path exists
-        if not self.output_path.exists():
-            return False, f"Output folder not found: {self.output_path}"
+        try:
+            os.stat(self.output_path)
+        except FileNotFoundError:
+            return False, f"Output folder not found: {self.output_path}", ErrorKind.OUT_ERROR
+        except OSError as e:
+            return False, f"Cannot access output folder: {str(e)}", ErrorKind.OUT_ERROR
         
         # Validate library structure
-        is_valid, error_msg = is_valid_library(str(self.library_path))
+        from selectLibrary import is_valid_library
+        is_valid, error_msg = is_valid_library(self._lib_str, library_stat)
         if not is_valid:
-            return False, error_msg
+            return False, error_msg, ErrorKind.LIB_ERROR
         
-        return True, None
+        return True, None, None
+    
+    @classmethod
+    def _scan_library(cls, library_path: str) -> tuple[str, List[str], List[str], Optional[str]]:
+        """Discover all library files in a single walk of the library folder.
+        
+        .fun and .lby files are only looked up in the library root,
+        .typ and .var files in the root and all subdirectories.
+        
+        Args:
+            library_path: Path to the library folder
+            
+        Returns:
+            tuple: (fun_file_name, type_file_paths, var_file_paths, lby_file_name or None)
+            
+        Raises:
+            ValueError: If no or multiple .fun files are found.
+        """
+        fun_files = []
+        lby_files = []
+        type_files = []
+        var_files = []
+        for root, dirs, files in os.walk(library_path):
+            for name in files:
+                if name.endswith('.typ'):
+                    type_files.append(os.path.join(root, name))
+                elif name.endswith('.var'):
+                    var_files.append(os.path.join(root, name))
+                elif root == library_path:
+                    if name.endswith('.fun'):
+                        fun_files.append(name)
+                    elif name.endswith('.lby'):
+                        lby_files.append(name)
+        
+        if len(fun_files) > 1:
+            raise ValueError("Library can only have 1 .fun file for declaration")
+        if len(fun_files) == 0:
+            raise ValueError("No .fun file found in library directory")
+        
+        return fun_files[0], type_files, var_files, lby_files[0] if lby_files else None
+    
+    @staticmethod
+    def _parse_files(parse_file: Callable, file_paths: List[str], cache) -> list:
+        """Parse every file, reusing cached results where possible.
+        
+        Args:
+            parse_file: Parse function taking a file path
+            file_paths: Files to parse
+            cache: ParseCache to read and update, or None to always parse
+            
+        Returns:
+            list: Parse results, in the same order as file_paths
+        """
+        results = []
+        for file_path in file_paths:
+            if cache is None:
+                results.append(parse_file(file_path))
+                continue
+            # Key the entry before parsing, so an edit made meanwhile invalidates it
+            result, key = cache.load(file_path)
+            if result is None:
+                result = parse_file(file_path)
+                cache.store(file_path, key, result)
+            results.append(result)
+        return results
     
     def process(self) -> Dict:
         """Process the library and generate CHM documentation.
@@ -66,136 +186,119 @@ class LibraryProcessor:
                 - success (bool): Whether processing succeeded
                 - chm_path (str): Path to generated CHM file (if successful)
                 - library (Library): Parsed library object (if successful)
-                - stats (dict): Statistics about parsed elements
                 - error (str): Error message (if failed)
+                - error_kind (ErrorKind): Category of the error (if failed)
         """
+        # Lazy import of parsers and CHM generator (keeps CLI --help/--version fast)
+        from parser import LibraryDeclarationFileParser, LibraryFileParser
+        from libraryToChm import LibraryDeclarationToChm
+        from parseCache import ParseCache
+        
         result = {
             'success': False,
             'chm_path': None,
             'library': None,
-            'stats': {},
-            'error': None
+            'error': None,
+            'error_kind': None
         }
         
+        # Validate inputs
+        is_valid, error_msg, error_kind = self.validate_inputs()
+        if not is_valid:
+            result['error'] = error_msg
+            result['error_kind'] = error_kind
+            return result
+        
+        # Get library file paths (single walk of the library folder)
         try:
-            # Validate inputs
-            is_valid, error_msg = self.validate_inputs()
-            if not is_valid:
-                result['error'] = error_msg
-                return result
-            
-            # Select and validate library
-            try:
-                select_lib = SelectLibrary(str(self.library_path))
-            except FileNotFoundError as e:
-                result['error'] = "Library folder not found or no longer accessible"
-                return result
-            except Exception as e:
-                result['error'] = f"Error accessing library folder: {str(e)}"
-                return result
-            
-            # Get library file paths
-            try:
-                lib_declaration_path = self.library_path / select_lib.get_library_declaration_path()
-                type_file_paths = select_lib.get_types_declaration_paths()
-                var_file_paths = select_lib.get_variable_declaration_paths()
-                lby_file_path = select_lib.get_library_metadata_path()
-            except Exception as e:
-                result['error'] = f"Could not read library declaration files: {str(e)}"
-                return result
-            
-            # Initialize collections
-            structures: List[Structure] = []
-            enumerations: List[Enumeration] = []
-            constants: List[VarConstant] = []
-            
-            # Parse library declaration file (.fun)
-            try:
-                libFileParser = LibraryDeclarationFileParser()
-                libFileParser.parse_fun_file(file_path=lib_declaration_path.as_posix())
-                library = libFileParser.get_library()
-            except FileNotFoundError:
-                result['error'] = f"Library declaration file not found: {lib_declaration_path}"
-                return result
-            except Exception as e:
-                result['error'] = f"Error parsing library declaration file (.fun): {str(e)}"
-                return result
-            
-            # Parse library metadata file (.lby) if it exists
-            if lby_file_path:
-                lby_full_path = self.library_path / lby_file_path
-                try:
-                    lbyParser = LibraryFileParser()
-                    lbyParser.parse_lby_file(file_path=lby_full_path.as_posix())
-                    lbyParser.update_library_object(library)
-                except Exception as e:
-                    # Continue with default values if .lby parsing fails
-                    # This is a non-critical error
-                    print(f"[WARNING] Could not parse library metadata file (.lby): {str(e)}")
-                    print(f"   Continuing with default metadata...")
-                    pass
-            
-            # Parse all types files in library folder
-            try:
-                for file_path in type_file_paths:
-                    typeFileParser = TypeFileParser()
-                    typeFileParser.parse_typ_file(file_path=file_path)
-                    structures.extend(typeFileParser.get_structures())
-                    enumerations.extend(typeFileParser.get_enumerations())
-            except Exception as e:
-                # Continue without structures/enumerations if parsing fails
-                # This is a non-critical error
-                print(f"[WARNING] Could not parse type files (.typ): {str(e)}")
-                print(f"   Continuing without structures and enumerations...")
-                pass
-            
-            library.structures = structures
-            library.enumerations = enumerations
-            
-            # Parse all variable files in library folder
+            fun_file_name, type_file_paths, var_file_paths, lby_file_path = self._scan_library(self._lib_str)
+            lib_declaration_path = os.path.join(self._lib_str, fun_file_name)
+        except (ValueError, OSError) as e:
+            result['error'] = f"Could not read library declaration files: {str(e)}"
+            result['error_kind'] = ErrorKind.LIB_ERROR
+            return result
+        
+        # Parse results of unchanged .typ/.var files are reused from the build folder, only
+        # when sources are kept (otherwise the output must only receive the CHM file)
+        cache = ParseCache(str(self.output_path)) if self.keep_sources and not self.use_help_folder else None
+        
+        # Parse library declaration file (.fun)
+        try:
+            libFileParser = LibraryDeclarationFileParser()
+            libFileParser.parse_fun_file(file_path=lib_declaration_path)
+            library = libFileParser.get_library()
+        except FileNotFoundError:
+            result['error'] = f"Library declaration file not found: {lib_declaration_path}"
+            result['error_kind'] = ErrorKind.LIB_ERROR
+            return result
+        except (ValueError, OSError) as e:
+            result['error'] = f"Error parsing library declaration file (.fun): {str(e)}"
+            result['error_kind'] = ErrorKind.PARSE_FAILED
+            return result
+        
+        # Parse library metadata file (.lby) if it exists
+        if lby_file_path:
+            lby_full_path = os.path.join(self._lib_str, lby_file_path)
             try:
-                for file_path in var_file_paths:
-                    varFileParser = VarFileParser()
-                    varFileParser.parse_var_file(file_path=file_path)
-                    constants.extend(varFileParser.get_constants())
-            except Exception as e:
-                # Continue without constants if parsing fails
+                lbyParser = LibraryFileParser()
+                lbyParser.parse_lby_file(file_path=lby_full_path)
+                lbyParser.update_library_object(library)
+            except (ValueError, OSError) as e:
+                # Continue with default values if .lby parsing fails
                 # This is a non-critical error
-                print(f"[WARNING] Could not parse variable files (.var): {str(e)}")
-                print(f"   Continuing without constants...")
+                print(f"[WARNING] Could not parse library metadata file (.lby): {str(e)}")
+                print(f"   Continuing with default metadata...")
                 pass
-            
-            library.constants = constants
-            
-            # Generate CHM file
-            try:
-                libraryToChm = LibraryDeclarationToChm(
-                    library=library,
-                    keep_sources=self.keep_sources,
-                    use_help_folder=self.use_help_folder
-                )
-                chm_path = libraryToChm.generate_library_chm(build_folder=str(self.output_path))
-            except PermissionError:
-                result['error'] = f"Permission denied when writing to build folder: {self.output_path}"
-                return result
-            except Exception as e:
-                result['error'] = f"Error generating CHM help file: {str(e)}"
-                return result
-            
-            # Build success result
-            result['success'] = True
-            result['chm_path'] = chm_path
-            result['library'] = library
-            result['stats'] = {
-                'functions': len(library.functions),
-                'function_blocks': len(library.function_blocks),
-                'structures': len(library.structures),
-                'enumerations': len(library.enumerations),
-                'constants': len(library.constants)
-            }
-            
+        
+        # Parse all types files in library folder (results go straight into the library)
+        library.structures = []
+        library.enumerations = []
+        try:
+            for file_structures, file_enumerations in self._parse_files(_parse_typ_file, type_file_paths, cache):
+                library.structures.extend(file_structures)
+                library.enumerations.extend(file_enumerations)
+        except (ValueError, OSError) as e:
+            # Continue without structures/enumerations if parsing fails
+            # This is a non-critical error
+            print(f"[WARNING] Could not parse type files (.typ): {str(e)}")
+            print(f"   Continuing without structures and enumerations...")
+            pass
+        
+        # Parse all variable files in library folder
+        library.constants = []
+        try:
+            for file_constants in self._parse_files(_parse_var_file, var_file_paths, cache):
+                library.constants.extend(file_constants)
+        except (ValueError, OSError) as e:
+            # Continue without constants if parsing fails
+            # This is a non-critical error
+            print(f"[WARNING] Could not parse variable files (.var): {str(e)}")
+            print(f"   Continuing without constants...")
+            pass
+        
+        # Library is read-only from here on: freeze collections for CHM generation
+        library.freeze()
+        
+        # Generate CHM file
+        try:
+            libraryToChm = LibraryDeclarationToChm(
+                library=library,
+                keep_sources=self.keep_sources,
+                use_help_folder=self.use_help_folder
+            )
+            chm_path = libraryToChm.generate_library_chm(build_folder=str(self.output_path))
+        except PermissionError:
+            result['error'] = f"Permission denied when writing to build folder: {self.output_path}"
+            result['error_kind'] = ErrorKind.OUT_ERROR
             return result
-            
-        except Exception as e:
-            result['error'] = f"Unexpected error: {str(e)}"
+        except (OSError, RuntimeError) as e:
+            result['error'] = f"Error generating CHM help file: {str(e)}"
+            result['error_kind'] = ErrorKind.CHM_FAILED
             return result
+        
+        # Build success result
+        result['success'] = True
+        result['chm_path'] = chm_path
+        result['library'] = library
+        
+        return result
@@ -7,24 +7,42 @@ This module defines dataclass structures for representing:
 - Structures and enumerations
 - Library metadata
 """
+import sys
 from dataclasses import dataclass, field
-from typing import List, Optional, Union
+from typing import Dict, List, NamedTuple, Optional, Sequence, Union
 
-@dataclass
-class Comment:
-    """Represents a variable comment."""
-    text: str
+from enums import ParameterType
 
-@dataclass
+# Shared BasicType instances by type name, see BasicType.get()
+_basic_type_cache: Dict[str, "BasicType"] = {}
+
+@dataclass(slots=True, frozen=True)
 class BasicType:
     """Represents a basic data type (e.g., INT, REAL, BOOL)."""
     type: str
 
+    @classmethod
+    def get(cls, type_str: str) -> "BasicType":
+        """Return the shared instance for a basic type name.
+        
+        Basic type names (BOOL, INT, UDINT...) repeat a lot, so one immutable
+        instance per name is created and reused.
+        
+        Args:
+            type_str: Basic type name
+        
+        Returns:
+            BasicType: Canonical instance for type_str
+        """
+        basic_type = _basic_type_cache.get(type_str)
+        if basic_type is None:
+            basic_type = _basic_type_cache[type_str] = cls(sys.intern(type_str))
+        return basic_type
+
     def __str__(self) -> str:
         return self.type
 
-@dataclass
-class ArrayDimension:
+class ArrayDimension(NamedTuple):
     """Represents a single dimension of an array with bounds.
     
     Attributes:
@@ -38,7 +56,7 @@ class ArrayDimension:
     is_constant_lower: bool
     is_constant_upper: bool
 
-@dataclass
+@dataclass(slots=True)
 class ArrayType:
     """Represents an array type with one or more dimensions.
     
@@ -48,16 +66,18 @@ class ArrayType:
     """
     base_type: str
     dimensions: List[ArrayDimension]
+    _str: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.base_type = sys.intern(self.base_type)
+        # Types are not modified after parsing, format once and reuse
+        dimensions = ",".join(f"{lower}..{upper}" for lower, upper, _, _ in self.dimensions)
+        self._str = f"{self.base_type}[{dimensions}]"
 
     def __str__(self) -> str:
-        returnStr = f"{self.base_type}["
-        for dim in self.dimensions:
-            returnStr += f"{dim.lower_bound}..{dim.upper_bound},"
-        # delete last comma
-        returnStr = f"{returnStr[:-1]}]"
-        return returnStr
-
-@dataclass
+        return self._str
+
+@dataclass(slots=True)
 class StringType:
     """Represents a STRING type with specified length.
     
@@ -67,12 +87,16 @@ class StringType:
     """
     length: Union[int, str]
     is_constant: bool
+    _str: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._str = f"STRING[{self.length}]"
 
     def __str__(self) -> str:
-        return f"STRING[{self.length}]"
+        return self._str
     
 
-@dataclass
+@dataclass(slots=True)
 class RangeType:
     """Represents a type with a range constraint (e.g., UDINT(1..9)).
     
@@ -88,14 +112,19 @@ class RangeType:
     upper_bound: Union[int, str]
     is_constant_lower: bool
     is_constant_upper: bool
+    _str: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.base_type = sys.intern(self.base_type)
+        self._str = f"{self.base_type}({self.lower_bound}..{self.upper_bound})"
 
     def __str__(self) -> str:
-        return f"{self.base_type}({self.lower_bound}..{self.upper_bound})"
+        return self._str
     
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class Variable:
-    """Base class for all variable types.
+    """Represents a variable, parameter, structure member or constant.
     
     Attributes:
         name: Variable name
@@ -107,6 +136,8 @@ class Variable:
         comment3: Third comment line
         default_value: Default initialization value
         retain: True if variable has RETAIN keyword
+        kind: Declaration section (VAR_INPUT, VAR_OUTPUT, VAR_IN_OUT or VAR)
+        is_constant: True if declared in a constant section
     """
     name: str
     type: Union[BasicType, ArrayType, StringType, RangeType]
@@ -117,33 +148,15 @@ class Variable:
     comment3: Optional[str] = None
     default_value: Optional[str] = None
     retain: bool = False
+    kind: ParameterType = ParameterType.VAR
+    is_constant: bool = False
 
-@dataclass
-class VarInput(Variable):
-    """Input variable (VAR_INPUT)."""
-    I_O: str = "IN"
-
-@dataclass
-class VarOutput(Variable):
-    """Output variable (VAR_OUTPUT)."""
-    I_O: str = "OUT"
+    @property
+    def I_O(self) -> str:
+        """Parameter direction label (IN, OUT, IN_OUT)."""
+        return self.kind.name
 
-@dataclass
-class VarInOut(Variable):
-    """Input/Output variable (VAR_IN_OUT)."""
-    I_O: str = "IN_OUT"
-
-@dataclass
-class Var(Variable):
-    """Local variable (VAR)."""
-    pass
-
-@dataclass
-class VarConstant(Variable):
-    """Constant variable (VAR CONSTANT)."""
-    pass
-
-@dataclass
+@dataclass(slots=True)
 class FunctionBlock:
     """Represents a B&R function block with all its variables.
     
@@ -158,13 +171,13 @@ class FunctionBlock:
     """
     name: str
     description: Optional[str] = None
-    var_input: List[VarInput] = field(default_factory=list)
-    var_output: List[VarOutput] = field(default_factory=list)
-    var: List[Var] = field(default_factory=list)
-    var_in_out: List[VarInOut] = field(default_factory=list)
-    var_constant: List[VarConstant] = field(default_factory=list)
+    var_input: List[Variable] = field(default_factory=list)
+    var_output: List[Variable] = field(default_factory=list)
+    var: List[Variable] = field(default_factory=list)
+    var_in_out: List[Variable] = field(default_factory=list)
+    var_constant: List[Variable] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class Function:
     """Represents a B&R function with return type.
     
@@ -179,17 +192,17 @@ class Function:
     name: str
     return_type: str
     description: Optional[str] = None
-    var_input: List[VarInput] = field(default_factory=list)
-    var_in_out: List[VarInOut] = field(default_factory=list)
-    var: List[Var] = field(default_factory=list)
+    var_input: List[Variable] = field(default_factory=list)
+    var_in_out: List[Variable] = field(default_factory=list)
+    var: List[Variable] = field(default_factory=list)
     
-@dataclass
+@dataclass(slots=True)
 class Structure:
     name: str
     members: List[Variable] = field(default_factory=list)
     description: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True, eq=False, repr=False)
 class EnumLiteral:
     """Represents a single literal value in an enumeration.
     
@@ -206,7 +219,7 @@ class EnumLiteral:
     comment2 : Optional[str] = None
     comment3 : Optional[str] = None
     
-@dataclass
+@dataclass(slots=True)
 class Enumeration:
     """Represents a B&R enumeration type.
     
@@ -221,7 +234,7 @@ class Enumeration:
     description: Optional[str] = None
     default_value: Optional[str] = None
     
-@dataclass
+@dataclass(slots=True)
 class Library:
     """Represents a complete B&R Automation Studio library.
     
@@ -239,17 +252,28 @@ class Library:
         structures: List of library structures
         enumerations: List of library enumerations
         constants: List of library constants
+    
+    The element collections (functions through constants) are lists while the
+    library is parsed and tuples once freeze() has been called.
     """
-    name: str = field(default="")
-    description: Optional[str] = field(default=None)
-    version: str = field(default="1.0.0")
-    type: Optional[str] = field(default=None)
-    header_file_name: Optional[str] = field(default=None)
-    file_version: Optional[str] = field(default=None)
-    files: Optional[List[str]] = field(default_factory=list)
-    dependency_libraries: Optional[List[dict]] = field(default_factory=list)
-    functions: Optional[List[Function]] = field(default_factory=list)
-    function_blocks: Optional[List[FunctionBlock]] = field(default_factory=list)
-    structures: Optional[List[Structure]] = field(default_factory=list)
-    enumerations: Optional[List[Enumeration]] = field(default_factory=list)
-    constants: Optional[List[VarConstant]] = field(default_factory=list)
\ No newline at end of file
+    name: str = ""
+    description: Optional[str] = None
+    version: str = "1.0.0"
+    type: Optional[str] = None
+    header_file_name: Optional[str] = None
+    file_version: Optional[str] = None
+    files: List[str] = field(default_factory=list)
+    dependency_libraries: List[dict] = field(default_factory=list)
+    functions: Sequence[Function] = field(default_factory=list)
+    function_blocks: Sequence[FunctionBlock] = field(default_factory=list)
+    structures: Sequence[Structure] = field(default_factory=list)
+    enumerations: Sequence[Enumeration] = field(default_factory=list)
+    constants: Sequence[Variable] = field(default_factory=list)
+
+    def freeze(self) -> None:
+        """Convert all element collections to tuples once parsing is finished."""
+        self.functions = tuple(self.functions)
+        self.function_blocks = tuple(self.function_blocks)
+        self.structures = tuple(self.structures)
+        self.enumerations = tuple(self.enumerations)
+        self.constants = tuple(self.constants)
\ No newline at end of file
@@ -3,10 +3,10 @@
 This module defines enumerations used throughout the application
 to categorize different types of data and parameters.
 """
-from enum import Enum
+from enum import IntEnum
 
 
-class DataTypeType(Enum):
+class DataTypeType(IntEnum):
     """Types of data type declarations in B&R libraries.
     
     Attributes:
@@ -15,13 +15,13 @@ class DataTypeType(Enum):
         FUNCTION_BLOCK: Function block type
         DERIVED: Derived/alias type
     """
-    ENUM: 0
-    STRUCT: 1
-    FUNCTION_BLOCK: 2
-    DERIVED: 3
+    ENUM = 0
+    STRUCT = 1
+    FUNCTION_BLOCK = 2
+    DERIVED = 3
 
 
-class ParameterType(Enum):
+class ParameterType(IntEnum):
     """Types of function/function block parameters.
     
     Attributes:
@@ -30,7 +30,7 @@ class ParameterType(Enum):
         IN_OUT: Input/output parameter
         VAR: Local variable
     """
-    IN: 0
-    OUT: 1
-    IN_OUT: 2
-    VAR: 3
+    IN = 0
+    OUT = 1
+    IN_OUT = 2
+    VAR = 3
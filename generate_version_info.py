@@ -9,18 +9,7 @@ Usage:
 from version import __version__, __author__, __description__
 from pathlib import Path
 
-def generate_version_info():
-    """Generate version_info.txt file for PyInstaller."""
-    
-    # Parse version string (e.g., "1.0.0" -> (1, 0, 0, 0))
-    version_parts = __version__.split('.')
-    while len(version_parts) < 4:
-        version_parts.append('0')
-    
-    file_version = ', '.join(version_parts[:4])
-    file_version_tuple = f"({', '.join(version_parts[:4])})"
-    
-    version_info_content = f"""# UTF-8
+_TEMPLATE = """# UTF-8
 #
 # Auto-generated from version.py
 # DO NOT EDIT MANUALLY - Run generate_version_info.py instead
@@ -55,23 +44,41 @@ VSVersionInfo(
       [
       StringTable(
         u'040904B0',
-        [StringStruct(u'CompanyName', u'{__author__}'),
-        StringStruct(u'FileDescription', u'{__description__}'),
-        StringStruct(u'FileVersion', u'{__version__}'),
+        [StringStruct(u'CompanyName', u'{author}'),
+        StringStruct(u'FileDescription', u'{description}'),
+        StringStruct(u'FileVersion', u'{version}'),
         StringStruct(u'InternalName', u'BRLibToHelp'),
-        StringStruct(u'LegalCopyright', u'Copyright (c) 2026 {__author__}'),
+        StringStruct(u'LegalCopyright', u'Copyright (c) 2026 {author}'),
         StringStruct(u'OriginalFilename', u'BRLibToHelp.exe'),
         StringStruct(u'ProductName', u'BRLibToHelp'),
-        StringStruct(u'ProductVersion', u'{__version__}')])
+        StringStruct(u'ProductVersion', u'{version}')])
       ]), 
     VarFileInfo([VarStruct(u'Translation', [1033, 1200])])
   ]
 )
 """
+
+def generate_version_info():
+    """Generate version_info.txt file for PyInstaller."""
+    
+    # Parse version string (e.g., "1.0.0" -> (1, 0, 0, 0))
+    version_parts = __version__.split('.')
+    while len(version_parts) < 4:
+        version_parts.append('0')
+    
+    file_version = ', '.join(version_parts[:4])
+    file_version_tuple = f"({', '.join(version_parts[:4])})"
+    
+    version_info_content = _TEMPLATE.format_map({
+        'file_version_tuple': file_version_tuple,
+        'author': __author__,
+        'description': __description__,
+        'version': __version__,
+    })
     
     # Write to file
     output_file = Path(__file__).parent / "version_info.txt"
-    output_file.write_text(version_info_content, encoding='utf-8')
+    output_file.write_bytes(version_info_content.encode('utf-8'))
     
     print(f"[OK] Generated version_info.txt")
     print(f"   Version: {__version__}")
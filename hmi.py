@@ -5,16 +5,48 @@ This module provides a Tkinter-based graphical user interface that allows users
 - Choose a build output directory
 - Generate CHM documentation from the library
 """
+import os
+import stat
 import tkinter as tk
 from tkinter import filedialog, messagebox
+from collections import OrderedDict
 from pathlib import Path
-from selectLibrary import is_valid_library
-import subprocess
-from os.path import normpath
 from utils import get_resource_path
-from core import LibraryProcessor
 from version import __version__
 
+# is_valid_library() results keyed by (library path, folder mtime), oldest entries evicted first
+_LIB_VALID_CACHE_SIZE = 64
+_lib_valid_cache: "OrderedDict[tuple[str, int], tuple[bool, str]]" = OrderedDict()
+
+# Message shown after a successful build
+_SUMMARY_TEMPLATE = (
+    "Library build successfully in {path}\n"
+    "Library Version: {version}\n"
+    "Library Type: {type}\n"
+    "Functions: {functions}\n"
+    "Function Blocks: {function_blocks}\n"
+    "Structures: {structures}\n"
+    "Enumerations: {enumerations}\n"
+    "Constants: {constants}"
+)
+
+
+def _load_processing_modules() -> None:
+    """Import the parser, CHM generator and parse cache modules (background prefetch)."""
+    import core
+    import parser
+    import libraryToChm
+    import parseCache
+
+
+def _dir_exists(path: str) -> bool:
+    """Check with a single stat that path exists and is a folder."""
+    try:
+        return stat.S_ISDIR(os.stat(path).st_mode)
+    except OSError:
+        return False
+
+
 class BRLibToMarkdownApp:
     """Main application class for the B&R Library to CHM converter.
     
@@ -31,12 +63,10 @@ class BRLibToMarkdownApp:
         self.root = root
         self.root.title(f"B&R Lib to CHM Help - v{__version__}")
         
-        # Set window icon if available
+        # Set window icon if available (iconbitmap fails on its own when the file is missing)
         try:
-            icon_path = get_resource_path("icon.ico")
-            if icon_path.exists():
-                self.root.iconbitmap(icon_path)
-        except Exception as e:
+            self.root.iconbitmap(get_resource_path("icon.ico"))
+        except (tk.TclError, OSError):
             # If icon cannot be loaded, continue without it
             pass
 
@@ -50,9 +80,9 @@ class BRLibToMarkdownApp:
         self.folder_path_library_label = tk.Label(root, text="Library folder path:")
         self.folder_path_library_label.grid(row=0, column=0, padx=10, pady=10, sticky="w")
 
-        self.folder_path_library_entry = tk.Entry(root, width=50)
+        self.folder_path_library_var = tk.StringVar(root)
+        self.folder_path_library_entry = tk.Entry(root, width=50, textvariable=self.folder_path_library_var, state="readonly")
         self.folder_path_library_entry.grid(row=0, column=1, padx=10, pady=10, sticky="ew")
-        self.folder_path_library_entry.config(state="readonly")
 
         self.folder_path_library_button = tk.Button(root, text="Browse", command=self.browse_folder_library)
         self.folder_path_library_button.grid(row=0, column=2, padx=10, pady=10)
@@ -61,9 +91,9 @@ class BRLibToMarkdownApp:
         self.folder_path_build_label = tk.Label(root, text="Build folder path:")
         self.folder_path_build_label.grid(row=1, column=0, padx=10, pady=10, sticky="w")
 
-        self.folder_path_build_entry = tk.Entry(root, width=50)
+        self.folder_path_build_var = tk.StringVar(root)
+        self.folder_path_build_entry = tk.Entry(root, width=50, textvariable=self.folder_path_build_var, state="readonly")
         self.folder_path_build_entry.grid(row=1, column=1, padx=10, pady=10, sticky="ew")
-        self.folder_path_build_entry.config(state="readonly")
 
         self.folder_path_build_button = tk.Button(root, text="Browse", command=self.browse_folder_build)
         self.folder_path_build_button.grid(row=1, column=2, padx=10, pady=10)
@@ -81,31 +111,49 @@ class BRLibToMarkdownApp:
         self.version_label = tk.Label(root, text=f"Version {__version__}", fg="gray", font=("Arial", 8))
         self.version_label.grid(row=4, column=0, columnspan=3, pady=(0, 10))
 
+        # Background worker running the conversion, created on first start
+        self._executor = None
+        self._busy = False
+        self._modules_prefetched = False
+        # Pending debounced validation (after() id)
+        self._validate_after_id = None
+
     def browse_folder_library(self):
         """Open a directory browser dialog to select the library folder."""
         folder_selected = filedialog.askdirectory()
         if folder_selected:
-            self.folder_path_library_entry.config(state="normal")
-            self.folder_path_library_entry.delete(0, tk.END)
-            self.folder_path_library_entry.insert(0, folder_selected)
-            self.folder_path_library_entry.config(state="readonly")
+            self.folder_path_library_var.set(folder_selected)
         self.start_is_valid()
 
     def browse_folder_build(self):
         """Open a directory browser dialog to select the build output folder."""
         folder_selected = filedialog.askdirectory()
         if folder_selected:
-            self.folder_path_build_entry.config(state="normal")
-            self.folder_path_build_entry.delete(0, tk.END)
-            self.folder_path_build_entry.insert(0, folder_selected)
-            self.folder_path_build_entry.config(state="readonly")
+            self.folder_path_build_var.set(folder_selected)
         self.start_is_valid()
 
 
     def start_is_valid(self) -> None:
+        """Schedule folder path validation once the selection has settled.
+        
+        Repeated calls within 250 ms collapse into a single validation run.
+        """
+        if self._validate_after_id is not None:
+            self.root.after_cancel(self._validate_after_id)
+        self._validate_after_id = self.root.after(250, self._do_validate)
+
+    def _do_validate(self) -> None:
         """Enable or disable the Start button based on folder path validation."""
+        self._validate_after_id = None
+        if self._busy:
+            # Start stays disabled until the running conversion finishes
+            return
         if self.folder_path_are_valid():
             self.start_button.config(state="normal")
+            if not self._modules_prefetched:
+                # Load the processing modules while the user is still choosing
+                self._modules_prefetched = True
+                self._get_executor().submit(_load_processing_modules)
         else:
             self.start_button.config(state="disabled")
 
@@ -115,29 +163,35 @@ class BRLibToMarkdownApp:
         Returns:
             bool: True if both paths are valid and library folder is a valid B&R library, False otherwise.
         """
-        folder_path_library = self.folder_path_library_entry.get()
-        folder_path_build = self.folder_path_build_entry.get()
+        folder_path_library = self.folder_path_library_var.get()
+        folder_path_build = self.folder_path_build_var.get()
         
         if folder_path_build == "" or folder_path_library == "":
             return False
         
-        # Check build path exists
-        build_path = Path(folder_path_build)
-        if not build_path.exists():
+        # Check build path is an existing folder
+        if not _dir_exists(folder_path_build):
             return False
         
-        # Check library path exists
-        library_path = Path(folder_path_library)
-        if not library_path.exists():
+        # Check library path exists (the stat result also keys the validation cache)
+        try:
+            library_stat = os.stat(folder_path_library)
+        except OSError:
             return False
         
-        # Check if library is valid
-        is_valid, error_msg = is_valid_library(folder_path_library)
+        # Check if library is valid, reusing the last result while the folder is unchanged
+        cache_key = (folder_path_library, library_stat.st_mtime_ns)
+        cached = _lib_valid_cache.get(cache_key)
+        if cached is None:
+            from selectLibrary import is_valid_library
+            cached = is_valid_library(folder_path_library, library_stat)
+            _lib_valid_cache[cache_key] = cached
+            if len(_lib_valid_cache) > _LIB_VALID_CACHE_SIZE:
+                _lib_valid_cache.popitem(last=False)
+        is_valid, error_msg = cached
         if not is_valid:
             # Clear the library path entry and show error
-            self.folder_path_library_entry.config(state="normal")
-            self.folder_path_library_entry.delete(0, tk.END)
-            self.folder_path_library_entry.config(state="readonly")
+            self.folder_path_library_var.set("")
             
             messagebox.showerror(
                 title="Invalid Library Folder",
@@ -150,21 +204,72 @@ class BRLibToMarkdownApp:
     def start(self):
         """Start the library to CHM conversion process.
         
-        This method uses the core LibraryProcessor to handle all business logic,
-        then displays the results in the GUI.
+        This method uses the core LibraryProcessor to handle all business logic.
+        Processing runs in a background thread so the Tk event loop stays responsive;
+        the results are displayed by _check_done() once it finishes.
         """
-        folder_path_library = self.folder_path_library_entry.get()
-        folder_path_build = self.folder_path_build_entry.get()
+        # Resolve both folders once, they are reused for processing and the summary
+        library_path = Path(self.folder_path_library_var.get()).resolve()
+        build_path = Path(self.folder_path_build_var.get()).resolve()
+        
+        # Lazy import: parsers and CHM generator are only needed once the user starts a build
+        from core import LibraryProcessor
         
         # Create processor (GUI always keeps sources)
         processor = LibraryProcessor(
-            library_path=folder_path_library,
-            output_path=folder_path_build,
+            library_path=library_path,
+            output_path=build_path,
             keep_sources=True
         )
         
-        # Process the library
-        result = processor.process()
+        # Process the library in the background and poll for completion
+        self._set_busy(True)
+        future = self._get_executor().submit(processor.process)
+        self.root.after(100, self._check_done, future, build_path)
+
+    def _get_executor(self):
+        """Return the background worker, creating it on first use.
+        
+        A single worker runs module prefetching and conversions one after the other.
+        """
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        return self._executor
+
+    def _set_busy(self, busy: bool) -> None:
+        """Lock or unlock the folder and Start buttons while a conversion is running.
+        
+        Args:
+            busy: True when a conversion starts, False once it has finished
+        """
+        self._busy = busy
+        state = "disabled" if busy else "normal"
+        self.folder_path_library_button.config(state=state)
+        self.folder_path_build_button.config(state=state)
+        self.start_button.config(state=state)
+
+    def _check_done(self, future, build_path: Path) -> None:
+        """Poll the background conversion and display its results once finished.
+        
+        Args:
+            future: Future returned by submitting LibraryProcessor.process()
+            build_path: Resolved build folder selected by the user
+        """
+        if not future.done():
+            self.root.after(100, self._check_done, future, build_path)
+            return
+        
+        self._set_busy(False)
+        try:
+            result = future.result()
+        except Exception as e:
+            # Anything process() does not report in its result (bug, unexpected parser error)
+            messagebox.showerror(
+                title="Error",
+                message=f"Unexpected error: {str(e)}"
+            )
+            return
         
         # Handle errors
         if not result['success']:
@@ -176,20 +281,21 @@ class BRLibToMarkdownApp:
         
         # Success - show summary
         library = result['library']
-        stats = result['stats']
         chm_path = result['chm_path']
-        library_folder_path_build = Path(folder_path_build).resolve() / library.name
+        library_folder_path_build = build_path / library.name
 
         messagebox.showinfo(
             title="Information",
-            message=f"Library build successfully in {library_folder_path_build.as_posix()}\n"
-                    f"Library Version: {library.version}\n"
-                    f"Library Type: {library.type if library.type else 'N/A'}\n"
-                    f"Functions: {stats['functions']}\n"
-                    f"Function Blocks: {stats['function_blocks']}\n"
-                    f"Structures: {stats['structures']}\n"
-                    f"Enumerations: {stats['enumerations']}\n"
-                    f"Constants: {stats['constants']}"
+            message=_SUMMARY_TEMPLATE.format(
+                path=library_folder_path_build.as_posix(),
+                version=library.version,
+                type=library.type if library.type else 'N/A',
+                functions=len(library.functions),
+                function_blocks=len(library.function_blocks),
+                structures=len(library.structures),
+                enumerations=len(library.enumerations),
+                constants=len(library.constants)
+            )
         )
 
         open_build = messagebox.askyesno(
@@ -202,7 +308,12 @@ class BRLibToMarkdownApp:
 
         # Open explorer to build folder
         try:
-            subprocess.run(['explorer', normpath(library_folder_path_build.as_posix())])
+            if hasattr(os, "startfile"):
+                os.startfile(library_folder_path_build)
+            else:
+                # No ShellExecute outside Windows: let the desktop open the folder
+                import subprocess
+                subprocess.Popen(['xdg-open', str(library_folder_path_build)])
         except Exception as e:
             messagebox.showerror(
                 title="Error",
@@ -3,8 +3,111 @@
 This module provides functionality to generate visual representations of
 B&R functions and function blocks as HTML tables with styling.
 """
+import html
+import io
 from datatypes import Function, FunctionBlock
+from functools import lru_cache
 from pathlib import Path
+from typing import Dict, Iterable
+
+_STYLE_PATH = Path(__file__).resolve().parent / "css" / "style.css"
+
+
+# Constant HTML fragments of the diagram, shared by the _write_* methods
+_FUB_TOP_BORDER = """
+            <tr>
+                <td></td>
+                <td class="fubTop"></td>
+                <td class="fubTop"></td>
+                <td></td>
+            </tr>"""
+_FUB_BOTTOM_BORDER = """
+            <tr>
+                <td></td>
+                <td class="fubBottom"></td>
+                <td class="fubBottom"></td>
+                <td></td>
+            </tr>"""
+# Fixed skeleton of the diagram table around the header and the column cells
+_FUB_TABLE_START = """
+        <table id="fub" cellspacing="0" class="fubLayout">
+            """ + _FUB_TOP_BORDER + """
+            """
+_FUB_TABLE_END = """
+            """ + _FUB_BOTTOM_BORDER + """
+        </table>"""
+_SECTION_START = """
+            <tr>
+                """
+_CELL_SEPARATOR = """
+                """
+_SECTION_END = """
+            </tr>"""
+_HR_CELL = """
+                            <td width="10">
+                                <hr width="20px" size="1" color="#000000">
+                            </td>"""
+_COLUMN_DTYPE_IN_START = """
+                <td class="fubDataTypeIn">
+                    <table class="fubData">"""
+_COLUMN_DTYPE_OUT_START = """
+                <td class="fubDataTypeOut">
+                    <table class="fubData">"""
+_COLUMN_END = """
+                    </table>
+                </td>"""
+_ROW_RIGHT_PRE = """
+                        <tr>
+                            <td class="fubElementRight">"""
+_ROW_DTYPE_IN_POST = "</td>" + _HR_CELL + """
+                        </tr>"""
+_ROW_DTYPE_OUT_PRE = """
+                        <tr>""" + _HR_CELL + """
+                            <td class="fubElementLeft">"""
+_ROW_LEFT_PRE = """
+                        <tr>
+                            <td class="fubElementLeft">"""
+_ROW_CENTER_PRE = """
+                        <tr>
+                            <td class="fubElementCenter">"""
+_ROW_POST = """</td>
+                        </tr>"""
+
+
+@lru_cache(maxsize=1)
+def _load_style() -> str:
+    """Read css/style.css once per process."""
+    return _STYLE_PATH.read_text(encoding="utf-8")
+
+
+@lru_cache(maxsize=1)
+def _style_section() -> str:
+    """Build the <style> section once per process."""
+    return f'\t<style type="text/css">\n{_load_style()}\n\t</style>'
+
+
+@lru_cache(maxsize=4096)
+def _typ(type_str: str, is_reference: bool) -> str:
+    """Return a datatype as shown in the diagram (HTML-escaped), references are prefixed with '&'."""
+    return html.escape("&" + type_str if is_reference else type_str, quote=False)
+
+
+@lru_cache(maxsize=4096)
+def _name(name: str) -> str:
+    """Return a name as shown in the diagram (HTML-escaped)."""
+    return html.escape(name, quote=False)
+
+
+def _fub_key(fb: Function | FunctionBlock) -> tuple:
+    """Return the structural key of a diagram: everything its HTML depends on."""
+    var_output = fb.var_output if isinstance(fb, FunctionBlock) else ()
+    return (
+        fb.name,
+        getattr(fb, "return_type", None),
+        tuple((var.name, str(var.type), var.is_reference) for var in fb.var_input),
+        tuple((var.name, str(var.type), var.is_reference) for var in var_output),
+        tuple((var.name, str(var.type), var.is_reference) for var in fb.var_in_out),
+    )
 
 
 class FunctionBlockHtmlGenerator:
@@ -12,10 +115,14 @@ class FunctionBlockHtmlGenerator:
     
     Generates styled HTML tables that visually represent B&R functions
     and function blocks with inputs, outputs, and in/out parameters.
+    
+    All parts of a diagram are written to one shared io.StringIO buffer
+    by the _write_* methods.
     """
     
     def __init__(self):
-        pass
+        # Rendered diagrams by structural key, FBs with the same signature share one entry
+        self._cache: Dict[tuple, str] = {}
     
     def generate_fub_diagram_html(self, fb: Function | FunctionBlock) -> str:
         """Generate the HTML for a function block diagram.
@@ -26,11 +133,29 @@ class FunctionBlockHtmlGenerator:
         Returns:
             HTML string with styled table representation.
         """
-        return self.generate_fub_table(fb)
+        key = _fub_key(fb)
+        html = self._cache.get(key)
+        if html is None:
+            html = self.generate_fub_table(fb)
+            self._cache[key] = html
+        return html
     
     def generate_fub_table(self, fb: Function | FunctionBlock) -> str:
         """Generate the complete function block table HTML.
         
+        Args:
+            fb: Function or FunctionBlock object.
+            
+        Returns:
+            HTML string with complete table structure.
+        """
+        buf = io.StringIO()
+        self._write_fub_table(fb, buf)
+        return buf.getvalue()
+    
+    def _write_fub_table(self, fb: Function | FunctionBlock, out: io.StringIO) -> None:
+        """Write the complete function block table HTML.
+        
         Creates a multi-section table with:
         - Header with name
         - Input/output section (orange background)
@@ -38,304 +163,200 @@ class FunctionBlockHtmlGenerator:
         
         Args:
             fb: Function or FunctionBlock object.
-            
-        Returns:
-            HTML string with complete table structure.
+            out: Buffer the HTML is written to.
         """
-        content = f"""
-        <table id="fub" cellspacing="0" class="fubLayout">
-            {self.generate_fub_top_border()}
-            {self.generate_table_header(fb)}"""
+        is_fb = isinstance(fb, FunctionBlock)
+        # Functions always have the return row, FBs only when they have inputs or outputs
+        has_orange = not is_fb or bool(fb.var_input or fb.var_output)
+        has_in_out = bool(fb.var_in_out)
+        
+        out.write(_FUB_TABLE_START)
+        self._write_table_header(fb, out)
         
         # Orange part (var_input and var_output)
-        if isinstance(fb, FunctionBlock) and max(len(fb.var_input), len(fb.var_output)) or isinstance(fb, Function):
-            content += f"""
-            <tr>
-                {self.generate_table_datatype_in(fb)}
-                {self.generate_table_in(fb)}
-                {self.generate_table_out(fb)}
-                {self.generate_table_datatype_out(fb)}
-            </tr>"""
+        if has_orange:
+            out.write(_SECTION_START)
+            self._write_table_datatype_in(fb, out)
+            out.write(_CELL_SEPARATOR)
+            self._write_table_in(fb, out)
+            out.write(_CELL_SEPARATOR)
+            self._write_table_out(fb, out, is_fb)
+            out.write(_CELL_SEPARATOR)
+            self._write_table_datatype_out(fb, out, is_fb)
+            out.write(_SECTION_END)
         
         # White part (var_in_out)
-        if len(fb.var_in_out) > 0:
-            content += f"""
-            <tr>
-                {self.generate_in_out_table_datatype_in(fb)}
-                {self.generate_in_out_table_in_out(fb)}
-                {self.generate_in_out_table_datatype_out(fb)}
-            </tr>"""
-        
-        content += f"""
-            {self.generate_fub_bottom_border()}
-        </table>"""
-        
-        return content
+        if has_in_out:
+            out.write(_SECTION_START)
+            self._write_in_out_table_datatype_in(fb, out)
+            out.write(_CELL_SEPARATOR)
+            self._write_in_out_table_in_out(fb, out)
+            out.write(_CELL_SEPARATOR)
+            self._write_in_out_table_datatype_out(fb, out)
+            out.write(_SECTION_END)
+        
+        out.write(_FUB_TABLE_END)
     
-    def generate_in_out_table_datatype_in(self, fb: Function | FunctionBlock) -> str:
-        """Generate the left datatype column for IN_OUT variables.
+    def _write_in_out_table_datatype_in(self, fb: Function | FunctionBlock, out: io.StringIO) -> None:
+        """Write the left datatype column for IN_OUT variables.
         
         Args:
             fb: Function or FunctionBlock object.
-            
-        Returns:
-            HTML string with datatype column for in/out parameters.
+            out: Buffer the HTML is written to.
         """
-        content = f"""
-                <td class="fubDataTypeIn">
-                    <table class="fubData">"""
-        
-        for var in fb.var_in_out:
-            if var.is_reference:
-                type_str = f"&{var.type}"
-            else:
-                type_str = var.type
-            content += f"""
-                        <tr>
-                            <td class="fubElementRight">{type_str}</td>
-                            <td width="10">
-                                <hr width="20px" size="1" color="#000000">
-                            </td>
-                        </tr>"""
-        content += f"""
-                    </table>
-                </td>"""
-        
-        return content
+        type_strs = (_typ(str(var.type), var.is_reference) for var in fb.var_in_out)
+        self._write_datatype_column(type_strs, out, hr_first=False)
     
-    def generate_in_out_table_datatype_out(self, fb: Function | FunctionBlock) -> str:
-        """Generate the right datatype column for IN_OUT variables.
+    def _write_in_out_table_datatype_out(self, fb: Function | FunctionBlock, out: io.StringIO) -> None:
+        """Write the right datatype column for IN_OUT variables.
         
         Args:
             fb: Function or FunctionBlock object.
-            
-        Returns:
-            HTML string with datatype column for in/out parameters.
+            out: Buffer the HTML is written to.
         """
-        content = f"""
-                <td class="fubDataTypeOut">
-                    <table class="fubData">"""
-        
-        for var in fb.var_in_out:
-            if var.is_reference:
-                type_str = f"&{var.type}"
-            else:
-                type_str = var.type
-            content += f"""
-                        <tr>
-                            <td width="10">
-                                <hr width="20px" size="1" color="#000000">
-                            </td>
-                            <td class="fubElementLeft">{type_str}</td>
-                        </tr>"""
-        content += f"""
-                    </table>
-                </td>"""
-        
-        return content
+        type_strs = (_typ(str(var.type), var.is_reference) for var in fb.var_in_out)
+        self._write_datatype_column(type_strs, out, hr_first=True)
     
-    def generate_in_out_table_in_out(self, fb: Function | FunctionBlock) -> str:
-        """Generate the center column for IN_OUT variable names.
+    def _write_in_out_table_in_out(self, fb: Function | FunctionBlock, out: io.StringIO) -> None:
+        """Write the center column for IN_OUT variable names.
         
         Args:
             fb: Function or FunctionBlock object.
-            
-        Returns:
-            HTML string with in/out parameter names.
+            out: Buffer the HTML is written to.
         """
-        content = f"""
+        out.write("""
                 <td colspan="2" class="fubInOut">
-                    <table>"""
+                    <table>""")
         
+        write = out.write
         for var in fb.var_in_out:
-            content += f"""
-                        <tr>
-                            <td class="fubElementCenter">{var.name}</td>
-                        </tr>"""
-        content += f"""
-                    </table>
-                </td>"""
-        
-        return content
+            write("".join((_ROW_CENTER_PRE, _name(var.name), _ROW_POST)))
+        out.write(_COLUMN_END)
     
-    def generate_fub_top_border(self) -> str:
-        """Generate the top border row of the function block.
-        
-        Returns:
-            HTML string with top border table row.
-        """
-        return f"""
-            <tr>
-                <td></td>
-                <td class="fubTop"></td>
-                <td class="fubTop"></td>
-                <td></td>
-            </tr>"""
-    
-    def generate_fub_bottom_border(self) -> str:
-        """Generate the bottom border row of the function block.
-        
-        Returns:
-            HTML string with bottom border table row.
-        """
-        return f"""
-            <tr>
-                <td></td>
-                <td class="fubBottom"></td>
-                <td class="fubBottom"></td>
-                <td></td>
-            </tr>"""
-    
-    def generate_table_header(self, fb: Function | FunctionBlock) -> str:
-        """Generate the header row with the function/function block name.
+    def _write_table_header(self, fb: Function | FunctionBlock, out: io.StringIO) -> None:
+        """Write the header row with the function/function block name.
         
         Args:
             fb: Function or FunctionBlock object.
-            
-        Returns:
-            HTML string with header row containing the name.
+            out: Buffer the HTML is written to.
         """
-        return f"""
+        out.write("""
             <th class="fubDataTypeIn"></th>
-            <th colspan="2" class="fubGradBlue">{fb.name}</th>
-            <th class="fubDataTypeOut"></th>"""
+            <th colspan="2" class="fubGradBlue">""")
+        out.write(_name(fb.name))
+        out.write("""</th>
+            <th class="fubDataTypeOut"></th>""")
     
-    def generate_table_datatype_in(self, fb: Function | FunctionBlock) -> str:
-        """Generate the left datatype column for input variables.
+    def _write_table_datatype_in(self, fb: Function | FunctionBlock, out: io.StringIO) -> None:
+        """Write the left datatype column for input variables.
         
         Args:
             fb: Function or FunctionBlock object.
-            
-        Returns:
-            HTML string with input datatypes column.
+            out: Buffer the HTML is written to.
         """
-        content = f"""
-                <td class="fubDataTypeIn">
-                    <table class="fubData">"""
-        
-        for var in fb.var_input:
-            if var.is_reference:
-                type_str = f"&{var.type}"
-            else:
-                type_str = var.type
-            content += f"""
-                        <tr>
-                            <td class="fubElementRight">{type_str}</td>
-                            <td width="10">
-                                <hr width="20px" size="1" color="#000000">
-                            </td>
-                        </tr>"""
-        content += f"""
-                    </table>
-                </td>"""
-        
-        return content
+        type_strs = (_typ(str(var.type), var.is_reference) for var in fb.var_input)
+        self._write_datatype_column(type_strs, out, hr_first=False)
     
-    def generate_table_in(self, fb: Function | FunctionBlock) -> str:
-        """Generate the input variables column.
+    def _write_table_in(self, fb: Function | FunctionBlock, out: io.StringIO) -> None:
+        """Write the input variables column.
         
         Args:
             fb: Function or FunctionBlock object.
-            
-        Returns:
-            HTML string with input variable names column.
+            out: Buffer the HTML is written to.
         """
-        content = f"""
+        out.write("""
                 <td class="fubGradOrange1">
-                    <table class="fubIn">"""
+                    <table class="fubIn">""")
         
+        write = out.write
         for var in fb.var_input:
-            content += f"""
-                        <tr>
-                            <td class="fubElementLeft">{var.name}</td>
-                        </tr>"""
-        content += f"""
-                    </table>
-                </td>"""
-        
-        return content
+            write("".join((_ROW_LEFT_PRE, _name(var.name), _ROW_POST)))
+        out.write(_COLUMN_END)
     
-    def generate_table_out(self, fb: Function | FunctionBlock) -> str:
-        """Generate the output variables column.
+    def _write_table_out(self, fb: Function | FunctionBlock, out: io.StringIO, is_fb: bool) -> None:
+        """Write the output variables column.
         
         For functions, shows 'return'. For function blocks, shows output variables.
         
         Args:
             fb: Function or FunctionBlock object.
-            
-        Returns:
-            HTML string with output variable names column.
+            out: Buffer the HTML is written to.
+            is_fb: True if fb is a FunctionBlock.
         """
-        content = f"""
+        out.write("""
                 <td class="fubGradOrange2">
-                    <table class="fubOut">"""
-        if isinstance(fb, FunctionBlock):
+                    <table class="fubOut">""")
+        if is_fb:
+            write = out.write
             for var in fb.var_output:
-                content += f"""
-                        <tr>
-                            <td class="fubElementRight">{var.name}</td>
-                        </tr>"""
+                write("".join((_ROW_RIGHT_PRE, _name(var.name), _ROW_POST)))
         else:
-            content += f"""
+            out.write("""
                         <tr>
                             <td class="fubElementRight">return</td>
-                        </tr>"""
+                        </tr>""")
         
-        content += f"""
-                    </table>
-                </td>"""
-        
-        return content
+        out.write(_COLUMN_END)
     
-    def generate_table_datatype_out(self, fb: Function | FunctionBlock) -> str:
-        """Generate the right datatype column for output variables.
+    def _write_table_datatype_out(self, fb: Function | FunctionBlock, out: io.StringIO, is_fb: bool) -> None:
+        """Write the right datatype column for output variables.
         
         For functions, shows return type. For function blocks, shows output types.
         
         Args:
             fb: Function or FunctionBlock object.
-            
-        Returns:
-            HTML string with output datatypes column.
+            out: Buffer the HTML is written to.
+            is_fb: True if fb is a FunctionBlock.
         """
-        content = f"""
-                <td class="fubDataTypeOut">
-                    <table class="fubData">"""
-        if isinstance(fb, FunctionBlock):
-            for var in fb.var_output:
-                content += f"""
-                        <tr>
-                            <td width="10">
-                                <hr width="20px" size="1" color="#000000">
-                            </td>
-                            <td class="fubElementLeft">{var.type}</td>
-                        </tr>"""
+        if is_fb:
+            self._write_datatype_column((_typ(str(var.type), False) for var in fb.var_output), out, hr_first=True)
         else:
-            content += f"""
+            out.write(_COLUMN_DTYPE_OUT_START)
+            out.write("""
                     <tr>
                         <td width="10">
                             <hr width="20px" size="1" color="#000000">
                         </td>
-                        <td class="fubElementLeft">{fb.return_type}</td>
-                    </tr>"""
+                        <td class="fubElementLeft">""")
+            out.write(_typ(fb.return_type, False))
+            out.write("""</td>
+                    </tr>""")
+            out.write(_COLUMN_END)
+    
+    def _write_datatype_column(self, type_strs: Iterable[str], out: io.StringIO, *, hr_first: bool) -> None:
+        """Write a datatype column.
         
-        content += f"""
-                    </table>
-                </td>"""
+        Columns left of the block (hr_first=False) show right-aligned datatypes
+        followed by the connector line, columns right of the block (hr_first=True)
+        show the connector line followed by left-aligned datatypes.
         
-        return content
+        Args:
+            type_strs: Datatypes to show, one row each.
+            out: Buffer the HTML is written to.
+            hr_first: True for a column right of the block.
+        """
+        if hr_first:
+            out.write(_COLUMN_DTYPE_OUT_START)
+            row_pre, row_post = _ROW_DTYPE_OUT_PRE, _ROW_POST
+        else:
+            out.write(_COLUMN_DTYPE_IN_START)
+            row_pre, row_post = _ROW_RIGHT_PRE, _ROW_DTYPE_IN_POST
+        
+        write = out.write
+        join = "".join
+        for type_str in type_strs:
+            write(join((row_pre, type_str, row_post)))
+        out.write(_COLUMN_END)
     
     def get_style_content(self) -> str:
-        """Read and return the CSS style content from the css/style.css file.
+        """Return the CSS style content from the css/style.css file.
+        
+        The file is read only once, later calls return the cached content.
         
         Returns:
             CSS content as a string.
         """
-        style_path = Path(__file__).parent.resolve()
-        style_path = style_path / "css/style.css"
-        with open(style_path.as_posix(), "r") as f:
-            file_content = f.read()
-        return file_content
+        return _load_style()
     
     def generate_style_section(self) -> str:
         """Generate the <style> section with the CSS content.
@@ -343,5 +364,4 @@ class FunctionBlockHtmlGenerator:
         Returns:
             HTML <style> tag with embedded CSS.
         """
-        style_content = self.get_style_content()
-        return f'\t<style type="text/css">\n{style_content}\n\t</style>'
+        return _style_section()
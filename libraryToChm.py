@@ -7,9 +7,9 @@ This module converts B&R library declarations into CHM help files with:
 - Hyperlinked type references
 - Visual function block diagrams
 """
-from datatypes import Library, Function, FunctionBlock, VarInput, VarOutput, Structure, Enumeration, VarConstant
+from datatypes import Library, Function, FunctionBlock, Variable, Structure, Enumeration
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Sequence, Tuple
 import subprocess
 import html
 import shutil
@@ -17,6 +17,16 @@ from htmlGenerator import FunctionBlockHtmlGenerator
 from utils import get_resource_path
 import re
 
+# Relative paths to the CHM root and its stylesheet from pages one folder below the root
+# (FBKs, DataTypes) and two folders below it (DataTypes/Structures, Enumerations, Constants)
+_ROOT_FROM_SECTION = "../"
+_CSS_FROM_SECTION = "../style.css"
+_ROOT_FROM_DATATYPE = "../../"
+_CSS_FROM_DATATYPE = "../../style.css"
+
+# Type decorators stripped by is_user_defined_type, in match order (upper case)
+_TYPE_PREFIXES = ("POINTER TO ", "REFERENCE TO ", "ARRAY [", "ARRAY OF ")
+
 
 class LibraryDeclarationToChm():
     """Generates CHM help files from B&R library declarations.
@@ -39,6 +49,14 @@ class LibraryDeclarationToChm():
         self.use_help_folder: bool = use_help_folder
         self.hhc_compiler_path = get_resource_path("bin/hhc.exe")
         self.html_generator = FunctionBlockHtmlGenerator()
+        # User-defined type names, for O(1) lookups when linking types
+        self._struct_names = frozenset(struct.name for struct in library.structures)
+        self._enum_names = frozenset(enum.name for enum in library.enumerations)
+        # All constant names in one alternation (longest first), None if there are no constants
+        constant_names = sorted({const.name for const in library.constants}, key=len, reverse=True)
+        self._constants_re = re.compile(r'\b(?:' + '|'.join(map(re.escape, constant_names)) + r')\b') if constant_names else None
+        # Rendered type links by (type_name, relative_path)
+        self._type_link_cache: Dict[Tuple[str, str], str] = {}
 
     def generate_library_chm(self, build_folder: str = "./build/") -> str:
         """Generate CHM file for the library and return the path to the generated .chm file.
@@ -58,12 +76,23 @@ class LibraryDeclarationToChm():
             # Normal mode: build/<LibraryName>/chm/
             path_build_folder = Path(build_folder) / self.library.name / "chm"
         
-        if not path_build_folder.exists():
-            path_build_folder.mkdir(parents=True)
-        
         # HTML files are directly in the CHM folder (no library name subfolder)
         lib_folder = path_build_folder
         
+        # Create the whole folder tree once, with a folder only for the sections that have content
+        # ("Samples" is optional - for future use)
+        sub_folders = ["Gen", "Samples"]
+        if self.library.functions or self.library.function_blocks:
+            sub_folders.append("FBKs")
+        if self.library.structures:
+            sub_folders.append("DataTypes/Structures")
+        if self.library.enumerations:
+            sub_folders.append("DataTypes/Enumerations")
+        if self.library.constants:
+            sub_folders.append("DataTypes/Constants")
+        for sub_folder in sub_folders:
+            (lib_folder / sub_folder).mkdir(parents=True, exist_ok=True)
+        
         # Copy CSS file to the CHM folder
         self.copy_css_file(lib_folder)
         
@@ -73,16 +102,14 @@ class LibraryDeclarationToChm():
         # Create HTML files for all content
         html_files = []
         
-        # Create "Gen" folder for general documentation (index page)
+        # "Gen" folder for general documentation (index page)
         gen_folder = lib_folder / "Gen"
-        if not gen_folder.exists():
-            gen_folder.mkdir(parents=True)
         
         # Generate index/home page in Gen folder
         index_file = self.generate_index_page(gen_folder)
         html_files.append(index_file)
         
-        # Create "FBKs" folder for Function blocks and Functions
+        # "FBKs" folder for Function blocks and Functions
         fbks_folder = lib_folder / "FBKs"
         
         # Generate functions and function blocks index
@@ -92,24 +119,20 @@ class LibraryDeclarationToChm():
         
         # Generate functions - each function gets its own HTML file directly in FBKs folder
         for func in self.library.functions:
-            if func is not None:
-                func_file = self.generate_function_file(fbks_folder, func)
-                html_files.append(func_file)
+            func_file = self.generate_function_file(fbks_folder, func)
+            html_files.append(func_file)
         
         # Generate function blocks - each FB gets its own HTML file directly in FBKs folder
         for fb in self.library.function_blocks:
-            if fb is not None:
-                fb_file = self.generate_function_block_file(fbks_folder, fb)
-                html_files.append(fb_file)
+            fb_file = self.generate_function_block_file(fbks_folder, fb)
+            html_files.append(fb_file)
         
         # Only generate DataTypes section if there are any datatypes
         has_datatypes = (self.library.structures or self.library.enumerations or self.library.constants)
         
         if has_datatypes:
-            # Create "DataTypes" folder for data types and constants
+            # "DataTypes" folder for data types and constants
             datatypes_folder = lib_folder / "DataTypes"
-            if not datatypes_folder.exists():
-                datatypes_folder.mkdir(parents=True)
             
             # Generate Data types and constants index
             dt_index_file = self.generate_data_types_and_constants_index(datatypes_folder)
@@ -120,29 +143,22 @@ class LibraryDeclarationToChm():
                 struct_index_file = self.generate_structures_index(datatypes_folder, self.library.structures)
                 html_files.append(struct_index_file)
                 for struct in self.library.structures:
-                    if struct is not None:
-                        struct_file = self.generate_structure_file(datatypes_folder, struct)
-                        html_files.append(struct_file)
+                    struct_file = self.generate_structure_file(datatypes_folder, struct)
+                    html_files.append(struct_file)
             
             # Generate enumerations
             if self.library.enumerations:
                 enum_index_file = self.generate_enumerations_index(datatypes_folder, self.library.enumerations)
                 html_files.append(enum_index_file)
                 for enum in self.library.enumerations:
-                    if enum is not None:
-                        enum_file = self.generate_enumeration_file(datatypes_folder, enum)
-                        html_files.append(enum_file)
+                    enum_file = self.generate_enumeration_file(datatypes_folder, enum)
+                    html_files.append(enum_file)
             
             # Generate constants
             if self.library.constants:
                 const_file = self.generate_constants_file(datatypes_folder, self.library.constants)
                 html_files.append(const_file)
         
-        # Create "Samples" folder (optional - for future use)
-        samples_folder = lib_folder / "Samples"
-        if not samples_folder.exists():
-            samples_folder.mkdir(parents=True)
-        
         # Generate CHM project files (in the root CHM folder, not in the library subfolder)
         hhp_file = self.generate_hhp_file(path_build_folder, html_files, lib_folder)
         hhc_file = self.generate_hhc_file(path_build_folder)
@@ -182,7 +198,7 @@ class LibraryDeclarationToChm():
         # Check if there are any functions or function blocks
         has_functions_or_fbs = (self.library.functions or self.library.function_blocks)
         
-        html_content = f"""<!DOCTYPE html>
+        parts = [f"""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
@@ -209,45 +225,46 @@ class LibraryDeclarationToChm():
                 <tr>
                     <td valign="TOP" class="parameter_tab"><strong>Version</strong></td>
                     <td valign="TOP" class="parameter_tab">{html.escape(self.library.version)}</td>
-                </tr>"""
+                </tr>"""]
+        append = parts.append
         
         # Add optional fields only if they exist
         if self.library.type:
-            html_content += f"""
+            append(f"""
                 <tr>
                     <td valign="TOP" class="parameter_tab"><strong>Type</strong></td>
                     <td valign="TOP" class="parameter_tab">{html.escape(self.library.type)}</td>
-                </tr>"""
+                </tr>""")
         
         if self.library.description:
-            html_content += f"""
+            append(f"""
                 <tr>
                     <td valign="TOP" class="parameter_tab"><strong>Description</strong></td>
                     <td valign="TOP" class="parameter_tab">{html.escape(self.library.description)}</td>
-                </tr>"""
+                </tr>""")
         
         if self.library.header_file_name:
-            html_content += f"""
+            append(f"""
                 <tr>
                     <td valign="TOP" class="parameter_tab"><strong>Header File</strong></td>
                     <td valign="TOP" class="parameter_tab">{html.escape(self.library.header_file_name)}</td>
-                </tr>"""
+                </tr>""")
         
         if self.library.file_version:
-            html_content += f"""
+            append(f"""
                 <tr>
                     <td valign="TOP" class="parameter_tab"><strong>Automation Studio Version</strong></td>
                     <td valign="TOP" class="parameter_tab">{html.escape(self.library.file_version)}</td>
-                </tr>"""
+                </tr>""")
         
-        html_content += """
+        append("""
             </tbody>
         </table>
-    </div>"""
+    </div>""")
         
         # Add dependencies section if there are any
-        if self.library.dependency_libraries and len(self.library.dependency_libraries) > 0:
-            html_content += """
+        if self.library.dependency_libraries:
+            append("""
     
     <div class="section">
         <h2>Dependencies</h2>
@@ -265,26 +282,26 @@ class LibraryDeclarationToChm():
                     </th>
                 </tr>
             </thead>
-            <tbody>"""
+            <tbody>""")
             
             for dep in self.library.dependency_libraries:
                 obj_name = html.escape(str(dep.get('object_name', '')))
                 from_ver = html.escape(str(dep.get('from_version', '')))
                 to_ver = html.escape(str(dep.get('to_version', '')))
-                html_content += f"""
+                append(f"""
                 <tr>
                     <td valign="TOP" class="parameter_tab">{obj_name}</td>
                     <td valign="TOP" class="parameter_tab">{from_ver}</td>
                     <td valign="TOP" class="parameter_tab">{to_ver}</td>
-                </tr>"""
+                </tr>""")
             
-            html_content += """
+            append("""
             </tbody>
         </table>
-    </div>"""
+    </div>""")
         
         # Add statistics section
-        html_content += f"""
+        append(f"""
     
     <div class="section">
         <h2>Library Statistics</h2>
@@ -317,22 +334,22 @@ class LibraryDeclarationToChm():
     <div class="section">
         <h2>Library Contents</h2>
         <ul>
-            """
+            """)
         if has_functions_or_fbs:
-            html_content += """<li><a href="../FBKs/FBKs.html">Functions and Function Blocks</a></li>"""
+            append("""<li><a href="../FBKs/FBKs.html">Functions and Function Blocks</a></li>""")
         
         if has_datatypes:
-            html_content += """
-            <li><a href="../DataTypes/DataTypes.html">Data types and constants</a></li>"""
+            append("""
+            <li><a href="../DataTypes/DataTypes.html">Data types and constants</a></li>""")
         
-        html_content += """
+        append("""
         </ul>
     </div>
 </body>
-</html>"""
+</html>""")
         
-        with open(html_file, "w", encoding='utf-8') as f:
-            f.write(html_content)
+        html_content = "".join(parts)
+        html_file.write_text(html_content, encoding='utf-8')
         
         return html_file
     
@@ -345,7 +362,7 @@ class LibraryDeclarationToChm():
         css_dest = build_folder / "style.css"
         
         # Copy the file
-        shutil.copy2(css_source, css_dest)
+        shutil.copyfile(css_source, css_dest)
         
         return css_dest
 
@@ -360,14 +377,14 @@ class LibraryDeclarationToChm():
         hhc_dest = build_folder / "hhc.exe"
         
         if hhc_source.exists():
-            shutil.copy2(hhc_source, hhc_dest)
+            shutil.copyfile(hhc_source, hhc_dest)
         else:
             raise FileNotFoundError(f"hhc.exe not found at {hhc_source}")
         
         # Copy dependencies (dll files) to build folder
         bin_folder = get_resource_path("bin")
         for dll_file in bin_folder.glob("*.dll"):
-            shutil.copy2(dll_file, build_folder / dll_file.name)
+            shutil.copyfile(dll_file, build_folder / dll_file.name)
         
         # Create .bat file to rebuild the CHM
         bat_file = build_folder / f"build_Lib{self.library.name}.bat"
@@ -397,8 +414,7 @@ if exist "{chm_filename}" (
 )
 """
         
-        with open(bat_file, "w", encoding='utf-8') as f:
-            f.write(bat_content)
+        bat_file.write_text(bat_content, encoding='utf-8')
         
         return hhc_dest, bat_file
 
@@ -415,31 +431,37 @@ if exist "{chm_filename}" (
         base_type = type_name.strip()
         
         # Remove common prefixes
-        prefixes_to_remove = ["POINTER TO ", "REFERENCE TO ", "ARRAY [", "ARRAY OF "]
-        for prefix in prefixes_to_remove:
-            if base_type.upper().startswith(prefix.upper()):
+        for prefix in _TYPE_PREFIXES:
+            if base_type[:len(prefix)].upper() == prefix:
                 base_type = base_type[len(prefix):].strip()
         
         # Remove array dimensions if present
         if '[' in base_type:
             base_type = base_type.split('[')[0].strip()
         
-        # Check if it's in structures
-        for struct in self.library.structures:
-            if struct.name == base_type:
-                return True
-        
-        # Check if it's in enumerations
-        for enum in self.library.enumerations:
-            if enum.name == base_type:
-                return True
-        
-        return False
+        return base_type in self._struct_names or base_type in self._enum_names
 
     def get_type_link(self, type_name: str, relative_path: str) -> str:
         """Get the HTML link for a user-defined type, or just the escaped type name if not user-defined.
         Also creates links for constants used in array dimensions.
         
+        Args:
+            type_name: The type name
+            relative_path: Relative path from current HTML file to the root of the CHM build
+        
+        Returns:
+            str: HTML string with link if user-defined, or escaped type name otherwise
+        """
+        key = (type_name, relative_path)
+        type_link = self._type_link_cache.get(key)
+        if type_link is None:
+            type_link = self._build_type_link(type_name, relative_path)
+            self._type_link_cache[key] = type_link
+        return type_link
+
+    def _build_type_link(self, type_name: str, relative_path: str) -> str:
+        """Build the HTML of get_type_link (uncached).
+        
         Args:
             type_name: The type name
             relative_path: Relative path from current HTML file to the root of the CHM build
@@ -455,24 +477,25 @@ if exist "{chm_filename}" (
         suffix = ""
         
         # Handle POINTER TO
-        if base_type.upper().startswith("POINTER TO "):
+        if base_type[:11].upper() == "POINTER TO ":
             prefix = "Pointer to "
             base_type = base_type[11:].strip()
         
         # Handle REFERENCE TO
-        if base_type.upper().startswith("REFERENCE TO "):
+        if base_type[:13].upper() == "REFERENCE TO ":
             prefix = "Reference to "
             base_type = base_type[13:].strip()
         
         # Handle ARRAY OF
-        if base_type.upper().startswith("ARRAY OF "):
+        if base_type[:9].upper() == "ARRAY OF ":
             prefix = prefix + "Array of "
             base_type = base_type[9:].strip()
         
         # Handle ARRAY [dimensions] OF type
-        if 'ARRAY [' in base_type.upper() or 'ARRAY[' in base_type.upper():
+        upper_type = base_type.upper()
+        if 'ARRAY [' in upper_type or 'ARRAY[' in upper_type:
             # Extract array dimensions
-            array_start_idx = base_type.upper().index('ARRAY')
+            array_start_idx = upper_type.index('ARRAY')
             # Find the opening bracket
             bracket_start = base_type.index('[', array_start_idx)
             bracket_count = 1
@@ -494,7 +517,7 @@ if exist "{chm_filename}" (
             
             # Find OF keyword
             remaining = base_type[bracket_end:].strip()
-            if remaining.upper().startswith('OF '):
+            if remaining[:3].upper() == 'OF ':
                 prefix = prefix + "Array " + array_dimensions + " of "
                 base_type = remaining[3:].strip()
             else:
@@ -522,56 +545,29 @@ if exist "{chm_filename}" (
             range_expr_with_links = self.link_constants_in_text(range_expr, relative_path)
             
             # Reconstruct the type with linked constants
-            base_type = f"{html.escape(range_base_type)}({range_expr_with_links})"
-            
-            # Check if the base type (before the range) is user-defined
-            is_structure = False
-            is_enumeration = False
+            range_base_name = html.escape(range_base_type)
+            base_type = f"{range_base_name}({range_expr_with_links})"
             
-            for struct in self.library.structures:
-                if struct.name == range_base_type:
-                    is_structure = True
-                    break
-            
-            if not is_structure:
-                for enum in self.library.enumerations:
-                    if enum.name == range_base_type:
-                        is_enumeration = True
-                        break
-            
-            # If the base type is user-defined, create a link for it
-            if is_structure:
-                link = f"{relative_path}DataTypes/Structures/{html.escape(range_base_type)}.html"
-                return f"{prefix}<a href=\"{link}\">{html.escape(range_base_type)}</a>({range_expr_with_links}){html.escape(suffix)}"
-            elif is_enumeration:
-                link = f"{relative_path}DataTypes/Enumerations/{html.escape(range_base_type)}.html"
-                return f"{prefix}<a href=\"{link}\">{html.escape(range_base_type)}</a>({range_expr_with_links}){html.escape(suffix)}"
+            # If the base type (before the range) is user-defined, create a link for it
+            if range_base_type in self._struct_names:
+                link = f"{relative_path}DataTypes/Structures/{range_base_name}.html"
+                return f"{prefix}<a href=\"{link}\">{range_base_name}</a>({range_expr_with_links}){html.escape(suffix)}"
+            elif range_base_type in self._enum_names:
+                link = f"{relative_path}DataTypes/Enumerations/{range_base_name}.html"
+                return f"{prefix}<a href=\"{link}\">{range_base_name}</a>({range_expr_with_links}){html.escape(suffix)}"
             else:
                 # Base type is not user-defined, just return with range
                 return f"{prefix}{base_type}{html.escape(suffix)}"
         
-        # Check if base type is user-defined
-        is_structure = False
-        is_enumeration = False
-        
-        for struct in self.library.structures:
-            if struct.name == base_type:
-                is_structure = True
-                break
-        
-        if not is_structure:
-            for enum in self.library.enumerations:
-                if enum.name == base_type:
-                    is_enumeration = True
-                    break
-        
         # Generate link if user-defined
-        if is_structure:
-            link = f"{relative_path}DataTypes/Structures/{html.escape(base_type)}.html"
-            return f"{prefix}<a href=\"{link}\">{html.escape(base_type)}</a>{html.escape(suffix)}"
-        elif is_enumeration:
-            link = f"{relative_path}DataTypes/Enumerations/{html.escape(base_type)}.html"
-            return f"{prefix}<a href=\"{link}\">{html.escape(base_type)}</a>{html.escape(suffix)}"
+        if base_type in self._struct_names:
+            base_name = html.escape(base_type)
+            link = f"{relative_path}DataTypes/Structures/{base_name}.html"
+            return f"{prefix}<a href=\"{link}\">{base_name}</a>{html.escape(suffix)}"
+        elif base_type in self._enum_names:
+            base_name = html.escape(base_type)
+            link = f"{relative_path}DataTypes/Enumerations/{base_name}.html"
+            return f"{prefix}<a href=\"{link}\">{base_name}</a>{html.escape(suffix)}"
         else:
             # Process any constants in the base type as well (in case there are expressions)
             base_type_with_links = self.link_constants_in_text(base_type, relative_path)
@@ -587,88 +583,45 @@ if exist "{chm_filename}" (
         Returns:
             str: Text with constant names replaced by HTML links, properly escaped
         """
-        if not self.library.constants:
+        if self._constants_re is None:
             return html.escape(text)
         
-        # Build a list of constant names sorted by length (longest first to avoid partial matches)
-        constant_names = sorted([const.name for const in self.library.constants], key=len, reverse=True)
-        
-        import re
-        replacements = []
-        
-        # Find all occurrences of constants in the text
-        for const_name in constant_names:
-            # Use word boundary matching
-            pattern = r'\b' + re.escape(const_name) + r'\b'
-            
-            for match in re.finditer(pattern, text):
-                start = match.start()
-                end = match.end()
-                # Check if this position is not already part of a replacement
-                overlaps = False
-                for existing_start, existing_end, _ in replacements:
-                    if not (end <= existing_start or start >= existing_end):
-                        overlaps = True
-                        break
-                
-                if not overlaps:
-                    replacements.append((start, end, const_name))
-        
-        # If no replacements, just escape and return
-        if not replacements:
-            return html.escape(text)
-        
-        # Sort replacements by position
-        replacements.sort(key=lambda x: x[0])
-        
-        # Build result by processing text in segments
-        result = ""
+        # Single pass over the text: escape the segments between matches, link the matches
+        link = f"{relative_path}DataTypes/Constants/Constants.html"
+        parts = []
         last_pos = 0
+        for match in self._constants_re.finditer(text):
+            const_name = html.escape(match.group())
+            parts.append(html.escape(text[last_pos:match.start()]))
+            parts.append(f'<a href="{link}#{const_name}">{const_name}</a>')
+            last_pos = match.end()
         
-        for start, end, const_name in replacements:
-            # Add escaped text before the constant
-            result += html.escape(text[last_pos:start])
-            
-            # Add the linked constant
-            link = f"{relative_path}DataTypes/Constants/Constants.html"
-            result += f'<a href="{link}#{html.escape(const_name)}">{html.escape(const_name)}</a>'
-            
-            last_pos = end
-        
-        # Add any remaining text after the last replacement
-        result += html.escape(text[last_pos:])
+        # Add any remaining text after the last match
+        parts.append(html.escape(text[last_pos:]))
         
-        return result
+        return "".join(parts)
 
     def generate_function_file(self, build_folder: Path, func: Function) -> Path:
-        """Generate an HTML file for a function directly in the FBKs folder."""
-        if not build_folder.exists():
-            build_folder.mkdir(parents=True)
-        html_file = build_folder / f"{func.name}.html"
+        """Generate an HTML file for a function directly in the FBKs folder.
         
-        # Calculate relative path to CSS from this HTML file (FBKs folder is one level below root)
-        css_relative_path = "../style.css"
-        # Relative path to root for type links
-        relative_path_to_root = "../"
+        The folder must exist (created by generate_library_chm or generate_functions_and_fbs_index).
+        """
+        html_file = build_folder / f"{func.name}.html"
         
-        with open(html_file, "w", encoding='utf-8') as f:
-            f.write(self.generate_html_content(func, "Function", css_relative_path, relative_path_to_root))
+        html_content = self.generate_html_content(func, "Function", _CSS_FROM_SECTION, _ROOT_FROM_SECTION)
+        html_file.write_text(html_content, encoding='utf-8')
         
         return html_file
 
     def generate_function_block_file(self, build_folder: Path, fb: FunctionBlock) -> Path:
-        """Generate an HTML file for a function block directly in the FBKs folder."""
-        if not build_folder.exists():
-            build_folder.mkdir(parents=True)
-        html_file = build_folder / f"{fb.name}.html"
+        """Generate an HTML file for a function block directly in the FBKs folder.
         
-        # Calculate relative path to CSS from this HTML file (FBKs folder is one level below root)
-        css_relative_path = "../style.css"
-        # Relative path to root for type links
-        relative_path_to_root = "../"
+        The folder must exist (created by generate_library_chm or generate_functions_and_fbs_index).
+        """
+        html_file = build_folder / f"{fb.name}.html"
         
-        with open(html_file, "w", encoding='utf-8') as f:
-            f.write(self.generate_html_content(fb, "Function block", css_relative_path, relative_path_to_root))
+        html_content = self.generate_html_content(fb, "Function block", _CSS_FROM_SECTION, _ROOT_FROM_SECTION)
+        html_file.write_text(html_content, encoding='utf-8')
         
         return html_file
 
@@ -720,7 +673,7 @@ if exist "{chm_filename}" (
             fb: Function or FunctionBlock to generate table for
             relative_path_to_root: Relative path from the HTML file to the CHM root folder
         """
-        html_table = """<table id="tableWithOption" class="parameter_tab" border="1">
+        parts = ["""<table id="tableWithOption" class="parameter_tab" border="1">
     <thead>
         <tr>
             <th class="auto-style1">
@@ -738,23 +691,24 @@ if exist "{chm_filename}" (
         </tr>
     </thead>
     <tbody>
-"""
+"""]
+        append = parts.append
         
         for var in fb.var_input:
-            html_table += self.generate_html_table_row(var, relative_path_to_root)
+            append(self.generate_html_table_row(var, relative_path_to_root))
         
         if isinstance(fb, FunctionBlock):
             for var in fb.var_output:
-                html_table += self.generate_html_table_row(var, relative_path_to_root)
+                append(self.generate_html_table_row(var, relative_path_to_root))
         for var in fb.var_in_out:
-            html_table += self.generate_html_table_row(var, relative_path_to_root)
+            append(self.generate_html_table_row(var, relative_path_to_root))
         
-        html_table += """    </tbody>
-</table>"""
+        append("""    </tbody>
+</table>""")
         
-        return html_table
+        return "".join(parts)
 
-    def generate_html_table_row(self, var: VarInput | VarOutput, relative_path_to_root: str = "../") -> str:
+    def generate_html_table_row(self, var: Variable, relative_path_to_root: str = "../") -> str:
         """Generate a single HTML table row for a variable.
         
         Args:
@@ -772,38 +726,35 @@ if exist "{chm_filename}" (
         comment = html.escape(var.comment1) if var.comment1 else ""
         
         return f"""        <tr>
-            <td valign="TOP" class="auto-style1">{html.escape(var.I_O)}</td>
+            <td valign="TOP" class="auto-style1">{var.I_O}</td>
             <td valign="TOP" class="parameter_tab">{html.escape(var.name)}</td>
             <td valign="TOP" class="parameter_tab">{var_type_html}</td>
             <td valign="TOP" class="parameter_tab">{comment}</td>
         </tr>
 """
 
-    def generate_functions_and_fbs_index(self, build_folder: Path, functions: List[Function], function_blocks: List[FunctionBlock]) -> Path:
+    def generate_functions_and_fbs_index(self, build_folder: Path, functions: Sequence[Function], function_blocks: Sequence[FunctionBlock]) -> Path:
         """Generate an index HTML file for functions and function blocks in FBKs folder."""
-        if not build_folder.exists():
-            build_folder.mkdir(parents=True)
+        build_folder.mkdir(parents=True, exist_ok=True)
         html_file = build_folder / "FBKs.html"
         
-        # Calculate relative path to CSS (FBKs folder is one level below root)
-        css_relative_path = "../style.css"
-        
-        html_content = f"""<!DOCTYPE html>
+        parts = [f"""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
     <meta http-equiv="X-UA-Compatible" content="IE=edge">
     <title>Functions and Function Blocks</title>
-    <link rel="stylesheet" type="text/css" href="{css_relative_path}">
+    <link rel="stylesheet" type="text/css" href="{_CSS_FROM_SECTION}">
 </head>
 <body>
     <h1>Functions and Function Blocks</h1>
     
-"""
+"""]
+        append = parts.append
         
         # Functions section
         if functions:
-            html_content += """
+            append("""
     <h2>Functions</h2>
     <table class="parameter_tab" border="1">
         <thead>
@@ -817,22 +768,23 @@ if exist "{chm_filename}" (
             </tr>
         </thead>
         <tbody>
-"""
+""")
             for func in functions:
+                func_name = html.escape(func.name)
                 description = html.escape(func.description.replace('\n', ' ').strip()) if func.description else ""
                 # Link directly to the HTML file in same folder (FBKs)
-                html_content += f"""            <tr>
-                <td valign="TOP" class="parameter_tab"><a href="{html.escape(func.name)}.html">{html.escape(func.name)}</a></td>
+                append(f"""            <tr>
+                <td valign="TOP" class="parameter_tab"><a href="{func_name}.html">{func_name}</a></td>
                 <td valign="TOP" class="parameter_tab">{description}</td>
             </tr>
-"""
-            html_content += """        </tbody>
+""")
+            append("""        </tbody>
     </table>
-"""
+""")
         
         # Function Blocks section
         if function_blocks:
-            html_content += """
+            append("""
     <h2>Function Blocks</h2>
     <table class="parameter_tab" border="1">
         <thead>
@@ -846,84 +798,78 @@ if exist "{chm_filename}" (
             </tr>
         </thead>
         <tbody>
-"""
+""")
             for fb in function_blocks:
+                fb_name = html.escape(fb.name)
                 description = html.escape(fb.description.replace('\n', ' ').strip()) if fb.description else ""
                 # Link directly to the HTML file in same folder (FBKs)
-                html_content += f"""            <tr>
-                <td valign="TOP" class="parameter_tab"><a href="{html.escape(fb.name)}.html">{html.escape(fb.name)}</a></td>
+                append(f"""            <tr>
+                <td valign="TOP" class="parameter_tab"><a href="{fb_name}.html">{fb_name}</a></td>
                 <td valign="TOP" class="parameter_tab">{description}</td>
             </tr>
-"""
-            html_content += """        </tbody>
+""")
+            append("""        </tbody>
     </table>
-"""
+""")
         
-        html_content += """
+        append("""
 </body>
-</html>"""
+</html>""")
         
-        with open(html_file, "w", encoding='utf-8') as f:
-            f.write(html_content)
+        html_content = "".join(parts)
+        html_file.write_text(html_content, encoding='utf-8')
         
         return html_file
 
     def generate_data_types_and_constants_index(self, build_folder: Path) -> Path:
         """Generate index HTML file for data types and constants in DataTypes folder."""
-        if not build_folder.exists():
-            build_folder.mkdir(parents=True)
+        build_folder.mkdir(parents=True, exist_ok=True)
         html_file = build_folder / "DataTypes.html"
         
-        # Calculate relative path to CSS (DataTypes folder is one level below root)
-        css_relative_path = "../style.css"
-        
-        html_content = f"""<!DOCTYPE html>
+        parts = [f"""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
     <meta http-equiv="X-UA-Compatible" content="IE=edge">
     <title>Data types and constants</title>
-    <link rel="stylesheet" type="text/css" href="{css_relative_path}">
+    <link rel="stylesheet" type="text/css" href="{_CSS_FROM_SECTION}">
 </head>
 <body>
     <h1>Data types and constants</h1>
 
     <h2>Contents</h2>
     <ul>
-"""
+"""]
+        append = parts.append
         if len(self.library.structures) > 0:
-            html_content += """        <li><a href="Structures/Structures.html">Structures</a></li>"""
+            append("""        <li><a href="Structures/Structures.html">Structures</a></li>""")
         if len(self.library.enumerations) > 0:
-            html_content += """        <li><a href="Enumerations/Enumerations.html">Enumerations</a></li>"""
+            append("""        <li><a href="Enumerations/Enumerations.html">Enumerations</a></li>""")
         if len(self.library.constants) > 0:
-            html_content += """        <li><a href="Constants/Constants.html">Constants</a></li>"""
-        html_content += """
+            append("""        <li><a href="Constants/Constants.html">Constants</a></li>""")
+        append("""
     </ul>
 </body>
-</html>"""
+</html>""")
         
-        with open(html_file, "w", encoding='utf-8') as f:
-            f.write(html_content)
+        html_content = "".join(parts)
+        html_file.write_text(html_content, encoding='utf-8')
         
         return html_file
 
-    def generate_structures_index(self, build_folder: Path, structures: List[Structure]) -> Path:
+    def generate_structures_index(self, build_folder: Path, structures: Sequence[Structure]) -> Path:
         """Generate index HTML file for structures."""
         folder_path = build_folder / "Structures"
-        if not folder_path.exists():
-            folder_path.mkdir(parents=True)
+        folder_path.mkdir(parents=True, exist_ok=True)
         html_file = folder_path / "Structures.html"
         
-        # Calculate relative path to CSS
-        css_relative_path = "../../style.css"
-        
-        html_content = f"""<!DOCTYPE html>
+        parts = [f"""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
     <meta http-equiv="X-UA-Compatible" content="IE=edge">
     <title>Structures</title>
-    <link rel="stylesheet" type="text/css" href="{css_relative_path}">
+    <link rel="stylesheet" type="text/css" href="{_CSS_FROM_DATATYPE}">
 </head>
 <body>
     <h1>Structures</h1>
@@ -941,48 +887,48 @@ if exist "{chm_filename}" (
             </tr>
         </thead>
         <tbody>
-"""
+"""]
+        append = parts.append
         
         for struct in structures:
+            struct_name = html.escape(struct.name)
             member_count = len(struct.members)
-            html_content += f"""            <tr>
-                <td valign="TOP" class="parameter_tab"><a href="{html.escape(struct.name)}.html">{html.escape(struct.name)}</a></td>
+            append(f"""            <tr>
+                <td valign="TOP" class="parameter_tab"><a href="{struct_name}.html">{struct_name}</a></td>
                 <td valign="TOP" class="parameter_tab">{struct.description if struct.description else ""}</td>
             </tr>
-"""
+""")
         
-        html_content += """        </tbody>
+        append("""        </tbody>
     </table>
 </body>
-</html>"""
+</html>""")
         
-        with open(html_file, "w", encoding='utf-8') as f:
-            f.write(html_content)
+        html_content = "".join(parts)
+        html_file.write_text(html_content, encoding='utf-8')
         
         return html_file
 
     def generate_structure_file(self, build_folder: Path, struct: Structure) -> Path:
-        """Generate HTML file for a single structure."""
+        """Generate HTML file for a single structure.
+        
+        The Structures folder must exist (created by generate_library_chm or generate_structures_index).
+        """
         folder_path = build_folder / "Structures"
-        if not folder_path.exists():
-            folder_path.mkdir(parents=True)
         html_file = folder_path / f"{struct.name}.html"
         
-        # Calculate relative path to CSS
-        css_relative_path = "../../style.css"
-        
         # Add description if available
         description_html = ""
         if struct.description:
             description_html = f"    <p>{html.escape(struct.description)}</p>\n    \n"
         
-        html_content = f"""<!DOCTYPE html>
+        parts = [f"""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
     <meta http-equiv="X-UA-Compatible" content="IE=edge">
     <title>{html.escape(struct.name)}</title>
-    <link rel="stylesheet" type="text/css" href="{css_relative_path}">
+    <link rel="stylesheet" type="text/css" href="{_CSS_FROM_DATATYPE}">
 </head>
 <body>
     <h1>{html.escape(struct.name)}</h1>
@@ -1005,46 +951,43 @@ if exist "{chm_filename}" (
             </tr>
         </thead>
         <tbody>
-"""
+"""]
+        append = parts.append
         
         for member in struct.members:
             # Generate link for user-defined types
-            member_type_html = self.get_type_link(str(member.type), "../../")
+            member_type_html = self.get_type_link(str(member.type), _ROOT_FROM_DATATYPE)
             comment = html.escape(member.comment1) if member.comment1 else ""
-            html_content += f"""            <tr>
+            append(f"""            <tr>
                 <td valign="TOP" class="parameter_tab">{html.escape(member.name)}</td>
                 <td valign="TOP" class="parameter_tab">{member_type_html}</td>
                 <td valign="TOP" class="parameter_tab">{comment}</td>
             </tr>
-"""
+""")
         
-        html_content += """        </tbody>
+        append("""        </tbody>
     </table>
 </body>
-</html>"""
+</html>""")
         
-        with open(html_file, "w", encoding='utf-8') as f:
-            f.write(html_content)
+        html_content = "".join(parts)
+        html_file.write_text(html_content, encoding='utf-8')
         
         return html_file
 
-    def generate_enumerations_index(self, build_folder: Path, enumerations: List[Enumeration]) -> Path:
+    def generate_enumerations_index(self, build_folder: Path, enumerations: Sequence[Enumeration]) -> Path:
         """Generate index HTML file for enumerations."""
         folder_path = build_folder / "Enumerations"
-        if not folder_path.exists():
-            folder_path.mkdir(parents=True)
+        folder_path.mkdir(parents=True, exist_ok=True)
         html_file = folder_path / "Enumerations.html"
         
-        # Calculate relative path to CSS
-        css_relative_path = "../../style.css"
-        
-        html_content = f"""<!DOCTYPE html>
+        parts = [f"""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
     <meta http-equiv="X-UA-Compatible" content="IE=edge">
     <title>Enumerations</title>
-    <link rel="stylesheet" type="text/css" href="{css_relative_path}">
+    <link rel="stylesheet" type="text/css" href="{_CSS_FROM_DATATYPE}">
 </head>
 <body>
     <h1>Enumerations</h1>
@@ -1065,38 +1008,38 @@ if exist "{chm_filename}" (
             </tr>
         </thead>
         <tbody>
-"""
+"""]
+        append = parts.append
         
         for enum in enumerations:
+            enum_name = html.escape(enum.name)
             literal_count = len(enum.literals)
             default_val = html.escape(enum.default_value) if enum.default_value else ""
-            html_content += f"""            <tr>
-                <td valign="TOP" class="parameter_tab"><a href="{html.escape(enum.name)}.html">{html.escape(enum.name)}</a></td>
+            append(f"""            <tr>
+                <td valign="TOP" class="parameter_tab"><a href="{enum_name}.html">{enum_name}</a></td>
                 <td valign="TOP" class="parameter_tab">{default_val}</td>
                 <td valign="TOP" class="parameter_tab">{html.escape(enum.description) if enum.description else ""}</td>
             </tr>
-"""
+""")
         
-        html_content += """        </tbody>
+        append("""        </tbody>
     </table>
 </body>
-</html>"""
+</html>""")
         
-        with open(html_file, "w", encoding='utf-8') as f:
-            f.write(html_content)
+        html_content = "".join(parts)
+        html_file.write_text(html_content, encoding='utf-8')
         
         return html_file
 
     def generate_enumeration_file(self, build_folder: Path, enum: Enumeration) -> Path:
-        """Generate HTML file for a single enumeration."""
+        """Generate HTML file for a single enumeration.
+        
+        The Enumerations folder must exist (created by generate_library_chm or generate_enumerations_index).
+        """
         folder_path = build_folder / "Enumerations"
-        if not folder_path.exists():
-            folder_path.mkdir(parents=True)
         html_file = folder_path / f"{enum.name}.html"
         
-        # Calculate relative path to CSS
-        css_relative_path = "../../style.css"
-        
         # Add description if available
         description_html = ""
         if enum.description:
@@ -1106,13 +1049,13 @@ if exist "{chm_filename}" (
         if enum.default_value:
             default_value_html = f"<p><strong>Default value:</strong> <code>{html.escape(enum.default_value)}</code></p>"
         
-        html_content = f"""<!DOCTYPE html>
+        parts = [f"""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
     <meta http-equiv="X-UA-Compatible" content="IE=edge">
     <title>{html.escape(enum.name)}</title>
-    <link rel="stylesheet" type="text/css" href="{css_relative_path}">
+    <link rel="stylesheet" type="text/css" href="{_CSS_FROM_DATATYPE}">
 </head>
 <body>
     <h1>{html.escape(enum.name)}</h1>
@@ -1137,45 +1080,42 @@ if exist "{chm_filename}" (
             </tr>
         </thead>
         <tbody>
-"""
+"""]
+        append = parts.append
         
         for literal in enum.literals:
             value = html.escape(literal.value) if literal.value else ""
             comment = html.escape(literal.comment1) if literal.comment1 else ""
-            html_content += f"""            <tr>
+            append(f"""            <tr>
                 <td valign="TOP" class="parameter_tab">{html.escape(literal.name)}</td>
                 <td valign="TOP" class="parameter_tab">{value}</td>
                 <td valign="TOP" class="parameter_tab">{comment}</td>
             </tr>
-"""
+""")
         
-        html_content += """        </tbody>
+        append("""        </tbody>
     </table>
 </body>
-</html>"""
+</html>""")
         
-        with open(html_file, "w", encoding='utf-8') as f:
-            f.write(html_content)
+        html_content = "".join(parts)
+        html_file.write_text(html_content, encoding='utf-8')
         
         return html_file
 
-    def generate_constants_file(self, build_folder: Path, constants: List[VarConstant]) -> Path:
+    def generate_constants_file(self, build_folder: Path, constants: Sequence[Variable]) -> Path:
         """Generate HTML file for all constants."""
         folder_path = build_folder / "Constants"
-        if not folder_path.exists():
-            folder_path.mkdir(parents=True)
+        folder_path.mkdir(parents=True, exist_ok=True)
         html_file = folder_path / "Constants.html"
         
-        # Calculate relative path to CSS
-        css_relative_path = "../../style.css"
-        
-        html_content = f"""<!DOCTYPE html>
+        parts = [f"""<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
     <meta http-equiv="X-UA-Compatible" content="IE=edge">
     <title>Constants</title>
-    <link rel="stylesheet" type="text/css" href="{css_relative_path}">
+    <link rel="stylesheet" type="text/css" href="{_CSS_FROM_DATATYPE}">
     <script>
         // Select text when navigating to an anchor
         window.addEventListener('DOMContentLoaded', function() {{
@@ -1235,29 +1175,31 @@ if exist "{chm_filename}" (
             </tr>
         </thead>
         <tbody>
-"""
+"""]
+        append = parts.append
         
         for const in constants:
+            const_name = html.escape(const.name)
             const_type = html.escape(str(const.type))
             # Apply constant linking to the value (in case it references other constants)
-            value = self.link_constants_in_text(const.default_value, "../../") if const.default_value else ""
+            value = self.link_constants_in_text(const.default_value, _ROOT_FROM_DATATYPE) if const.default_value else ""
             comment = html.escape(const.comment1) if const.comment1 else ""
             # Add an anchor for each constant so links can jump to it
-            html_content += f"""            <tr id="{html.escape(const.name)}">
-                <td valign="TOP" class="parameter_tab"><a name="{html.escape(const.name)}"></a>{html.escape(const.name)}</td>
+            append(f"""            <tr id="{const_name}">
+                <td valign="TOP" class="parameter_tab"><a name="{const_name}"></a>{const_name}</td>
                 <td valign="TOP" class="parameter_tab">{const_type}</td>
                 <td valign="TOP" class="parameter_tab">{value}</td>
                 <td valign="TOP" class="parameter_tab">{comment}</td>
             </tr>
-"""
+""")
         
-        html_content += """        </tbody>
+        append("""        </tbody>
     </table>
 </body>
-</html>"""
+</html>""")
         
-        with open(html_file, "w", encoding='utf-8') as f:
-            f.write(html_content)
+        html_content = "".join(parts)
+        html_file.write_text(html_content, encoding='utf-8')
         
         return html_file
 
@@ -1290,6 +1232,9 @@ if exist "{chm_filename}" (
             except ValueError:
                 pass
         
+        # One file per line in the [FILES] section
+        files_section = "".join(f"{file}\n" for file in relative_files)
+        
         hhp_content = f"""[OPTIONS]
 Compatibility=1.1 or later
 Compiled file=Lib{self.library.name}.chm
@@ -1301,17 +1246,11 @@ Language=0x409 English (United States)
 Title={self.library.name} - Library Documentation
 
 [FILES]
-"""
-        
-        for file in relative_files:
-            hhp_content += f"{file}\n"
-        
-        hhp_content += """
+{files_section}
 [INFOTYPES]
 """
         
-        with open(hhp_file, "w", encoding='utf-8') as f:
-            f.write(hhp_content)
+        hhp_file.write_text(hhp_content, encoding='utf-8')
         
         return hhp_file
 
@@ -1328,7 +1267,7 @@ Title={self.library.name} - Library Documentation
         # Check if there are any datatypes
         has_datatypes = (self.library.structures or self.library.enumerations or self.library.constants)
         
-        hhc_content = f"""<!DOCTYPE HTML PUBLIC "-//IETF//DTD HTML//EN">
+        parts = [f"""<!DOCTYPE HTML PUBLIC "-//IETF//DTD HTML//EN">
 <HTML>
 <HEAD>
 <meta name="GENERATOR" content="Microsoft&reg; HTML Help Workshop 4.1">
@@ -1342,100 +1281,101 @@ Title={self.library.name} - Library Documentation
         <param name="Name" value="General">
         <param name="Local" value="Gen/index.html">
         </OBJECT>
-"""
+"""]
+        append = parts.append
         
         # Functions and Function Blocks section - single folder with all FBs and Functions
         if self.library.functions or self.library.function_blocks:
-            hhc_content += f"""    <LI> <OBJECT type="text/sitemap">
+            append(f"""    <LI> <OBJECT type="text/sitemap">
         <param name="Name" value="FBKs and Functions">
         <param name="Local" value="FBKs/FBKs.html">
         </OBJECT>
         <UL>
-"""
+""")
             
             # Add all functions directly under "FBKs and Functions"
             for func in self.library.functions:
-                if func is not None:
-                    hhc_content += f"""            <LI> <OBJECT type="text/sitemap">
-                <param name="Name" value="{html.escape(func.name)}">
-                <param name="Local" value="FBKs/{html.escape(func.name)}.html">
+                func_name = html.escape(func.name)
+                append(f"""            <LI> <OBJECT type="text/sitemap">
+                <param name="Name" value="{func_name}">
+                <param name="Local" value="FBKs/{func_name}.html">
                 </OBJECT>
-"""
+""")
             
             # Add all function blocks directly under "FBKs and Functions"
             for fb in self.library.function_blocks:
-                if fb is not None:
-                    hhc_content += f"""            <LI> <OBJECT type="text/sitemap">
-                <param name="Name" value="{html.escape(fb.name)}">
-                <param name="Local" value="FBKs/{html.escape(fb.name)}.html">
+                fb_name = html.escape(fb.name)
+                append(f"""            <LI> <OBJECT type="text/sitemap">
+                <param name="Name" value="{fb_name}">
+                <param name="Local" value="FBKs/{fb_name}.html">
                 </OBJECT>
-"""
+""")
             
-            hhc_content += """        </UL>
-"""
+            append("""        </UL>
+""")
         
         # Data types and constants section - only if there are datatypes
         if has_datatypes:
-            hhc_content += f"""    <LI> <OBJECT type="text/sitemap">
+            append(f"""    <LI> <OBJECT type="text/sitemap">
         <param name="Name" value="Data types and constants">
         <param name="Local" value="DataTypes/DataTypes.html">
         </OBJECT>
         <UL>
-"""
+""")
             
             # Structures
             if self.library.structures:
-                hhc_content += f"""            <LI> <OBJECT type="text/sitemap">
+                append(f"""            <LI> <OBJECT type="text/sitemap">
                 <param name="Name" value="Structures">
                 <param name="Local" value="DataTypes/Structures/Structures.html">
                 </OBJECT>
                 <UL>
-"""
+""")
                 for struct in self.library.structures:
-                    if struct is not None:
-                        hhc_content += f"""                    <LI> <OBJECT type="text/sitemap">
-                        <param name="Name" value="{html.escape(struct.name)}">
-                        <param name="Local" value="DataTypes/Structures/{html.escape(struct.name)}.html">
+                    struct_name = html.escape(struct.name)
+                    append(f"""                    <LI> <OBJECT type="text/sitemap">
+                        <param name="Name" value="{struct_name}">
+                        <param name="Local" value="DataTypes/Structures/{struct_name}.html">
                         </OBJECT>
-"""
-                hhc_content += """                </UL>
-"""
+""")
+                append("""                </UL>
+""")
             
             # Enumerations
             if self.library.enumerations:
-                hhc_content += f"""            <LI> <OBJECT type="text/sitemap">
+                append(f"""            <LI> <OBJECT type="text/sitemap">
                 <param name="Name" value="Enumerations">
                 <param name="Local" value="DataTypes/Enumerations/Enumerations.html">
                 </OBJECT>
                 <UL>
-"""
+""")
                 for enum in self.library.enumerations:
-                    if enum is not None:
-                        hhc_content += f"""                    <LI> <OBJECT type="text/sitemap">
-                        <param name="Name" value="{html.escape(enum.name)}">
-                        <param name="Local" value="DataTypes/Enumerations/{html.escape(enum.name)}.html">
+                    enum_name = html.escape(enum.name)
+                    append(f"""                    <LI> <OBJECT type="text/sitemap">
+                        <param name="Name" value="{enum_name}">
+                        <param name="Local" value="DataTypes/Enumerations/{enum_name}.html">
                         </OBJECT>
-"""
-                hhc_content += """                </UL>
-"""
+""")
+                append("""                </UL>
+""")
             
             # Constants
             if self.library.constants:
-                hhc_content += f"""            <LI> <OBJECT type="text/sitemap">
+                append(f"""            <LI> <OBJECT type="text/sitemap">
                 <param name="Name" value="Constants">
                 <param name="Local" value="DataTypes/Constants/Constants.html">
                 </OBJECT>
-"""
+""")
             
-            hhc_content += """        </UL>
-"""
+            append("""        </UL>
+""")
         
-        hhc_content += """</UL>
+        append("""</UL>
 </BODY></HTML>
-"""
+""")
         
-        with open(hhc_file, "w", encoding='utf-8') as f:
-            f.write(hhc_content)
+        hhc_content = "".join(parts)
+        hhc_file.write_text(hhc_content, encoding='utf-8')
         
         return hhc_file
 
@@ -1443,66 +1383,67 @@ Title={self.library.name} - Library Documentation
         """Generate HTML Help Index (.hhk) file - keyword index with 'Lib' prefix."""
         hhk_file = build_folder / f"Lib{self.library.name}.hhk"
         
-        hhk_content = """<!DOCTYPE HTML PUBLIC "-//IETF//DTD HTML//EN">
+        parts = ["""<!DOCTYPE HTML PUBLIC "-//IETF//DTD HTML//EN">
 <HTML>
 <HEAD>
 <meta name="GENERATOR" content="Microsoft&reg; HTML Help Workshop 4.1">
 <!-- Sitemap 1.0 -->
 </HEAD><BODY>
 <UL>
-"""
+"""]
+        append = parts.append
         
         # Add functions to index
         for func in self.library.functions:
-            if func is not None:
-                hhk_content += f"""    <LI> <OBJECT type="text/sitemap">
-        <param name="Name" value="{html.escape(func.name)}">
-        <param name="Local" value="FBKs/{html.escape(func.name)}.html">
+            func_name = html.escape(func.name)
+            append(f"""    <LI> <OBJECT type="text/sitemap">
+        <param name="Name" value="{func_name}">
+        <param name="Local" value="FBKs/{func_name}.html">
         </OBJECT>
-"""
+""")
         
         # Add function blocks to index
         for fb in self.library.function_blocks:
-            if fb is not None:
-                hhk_content += f"""    <LI> <OBJECT type="text/sitemap">
-        <param name="Name" value="{html.escape(fb.name)}">
-        <param name="Local" value="FBKs/{html.escape(fb.name)}.html">
+            fb_name = html.escape(fb.name)
+            append(f"""    <LI> <OBJECT type="text/sitemap">
+        <param name="Name" value="{fb_name}">
+        <param name="Local" value="FBKs/{fb_name}.html">
         </OBJECT>
-"""
+""")
         
         # Add structures to index
         for struct in self.library.structures:
-            if struct is not None:
-                hhk_content += f"""    <LI> <OBJECT type="text/sitemap">
-        <param name="Name" value="{html.escape(struct.name)}">
-        <param name="Local" value="DataTypes/Structures/{html.escape(struct.name)}.html">
+            struct_name = html.escape(struct.name)
+            append(f"""    <LI> <OBJECT type="text/sitemap">
+        <param name="Name" value="{struct_name}">
+        <param name="Local" value="DataTypes/Structures/{struct_name}.html">
         </OBJECT>
-"""
+""")
         
         # Add enumerations to index
         for enum in self.library.enumerations:
-            if enum is not None:
-                hhk_content += f"""    <LI> <OBJECT type="text/sitemap">
-        <param name="Name" value="{html.escape(enum.name)}">
-        <param name="Local" value="DataTypes/Enumerations/{html.escape(enum.name)}.html">
+            enum_name = html.escape(enum.name)
+            append(f"""    <LI> <OBJECT type="text/sitemap">
+        <param name="Name" value="{enum_name}">
+        <param name="Local" value="DataTypes/Enumerations/{enum_name}.html">
         </OBJECT>
-"""
+""")
         
         # Add constants to index so users can find them via Index tab
         for const in self.library.constants:
-            if const is not None:
-                hhk_content += f"""    <LI> <OBJECT type="text/sitemap">
-        <param name="Name" value="{html.escape(const.name)}">
-        <param name="Local" value="DataTypes/Constants/Constants.html#{html.escape(const.name)}">
+            const_name = html.escape(const.name)
+            append(f"""    <LI> <OBJECT type="text/sitemap">
+        <param name="Name" value="{const_name}">
+        <param name="Local" value="DataTypes/Constants/Constants.html#{const_name}">
         </OBJECT>
-"""
+""")
         
-        hhk_content += """</UL>
+        append("""</UL>
 </BODY></HTML>
-"""
+""")
         
-        with open(hhk_file, "w", encoding='utf-8') as f:
-            f.write(hhk_content)
+        hhk_content = "".join(parts)
+        hhk_file.write_text(hhk_content, encoding='utf-8')
         
         return hhk_file
 
@@ -0,0 +1,149 @@
+"""Persistent cache of parsed .typ/.var file results.
+
+Libraries rarely change between builds, so the parse result of each file is
+pickled into <build folder>/.brlib_parse_cache and reused on the next run
+while the file is unchanged.
+"""
+import hashlib
+import os
+import pickle
+from functools import lru_cache
+from typing import Any, Optional, Tuple
+
+from version import __version__
+
+CACHE_DIR_NAME = ".brlib_parse_cache"
+
+# Number of leading bytes hashed to detect changes that keep size and mtime
+_HEAD_SIZE = 4096
+
+# Only the parse result types may be unpickled from a cache entry
+_ALLOWED_CLASSES = frozenset({
+    ("datatypes", "ArrayDimension"),
+    ("datatypes", "ArrayType"),
+    ("datatypes", "BasicType"),
+    ("datatypes", "EnumLiteral"),
+    ("datatypes", "Enumeration"),
+    ("datatypes", "RangeType"),
+    ("datatypes", "StringType"),
+    ("datatypes", "Structure"),
+    ("datatypes", "Variable"),
+    ("enums", "ParameterType"),
+})
+
+
+class _ResultUnpickler(pickle.Unpickler):
+    """Unpickler refusing every global that is not a parse result type."""
+
+    def find_class(self, module: str, name: str) -> Any:
+        if (module, name) not in _ALLOWED_CLASSES:
+            raise pickle.UnpicklingError(f"{module}.{name} is not allowed in a parse cache entry")
+        return super().find_class(module, name)
+
+
+@lru_cache(maxsize=1)
+def _code_version() -> str:
+    """Return a fingerprint of the code producing the cached results.
+
+    Hashes the sources of the parser and data type modules, so that entries
+    written by a different parser are never reused. Falls back to the tool
+    version when the sources are not available (frozen executable).
+    """
+    import datatypes
+    import enums
+    import parser
+    digest = hashlib.blake2b(__version__.encode('utf-8'))
+    try:
+        for module in (parser, datatypes, enums):
+            with open(module.__file__, 'rb') as file:
+                digest.update(file.read())
+    except (OSError, TypeError):
+        return __version__
+    return digest.hexdigest()
+
+
+class ParseCache:
+    """On-disk cache of parse results, one pickle file per source file.
+
+    An entry is valid while the parser code, the file size, its mtime and the
+    hash of its first 4 KiB all match the values stored with it. Entries are
+    unpickled with an unpickler that only accepts the parse result types.
+
+    Args:
+        build_folder: Build output folder holding the cache directory
+    """
+
+    def __init__(self, build_folder: str):
+        """Initialize the cache.
+
+        Args:
+            build_folder: Build output folder holding the cache directory
+        """
+        self.cache_dir = os.path.join(build_folder, CACHE_DIR_NAME)
+
+    def _entry_path(self, file_path: str) -> str:
+        """Return the cache entry path for a source file."""
+        name = hashlib.sha1(file_path.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{name}.pkl")
+
+    def _file_key(self, file_path: str) -> tuple:
+        """Compute the validation key of a source file."""
+        file_stat = os.stat(file_path)
+        with open(file_path, 'rb') as file:
+            head = file.read(_HEAD_SIZE)
+        return (_code_version(), file_stat.st_size, file_stat.st_mtime_ns, hashlib.blake2b(head).hexdigest())
+
+    def load(self, file_path: str) -> Tuple[Optional[Any], Optional[tuple]]:
+        """Return the cached parse result of a file.
+
+        The validation key is computed before the entry is read. On a miss the
+        caller parses the file and hands the key to store(), so a file changed
+        while it is parsed is never cached under its new key.
+
+        Args:
+            file_path: Source file to look up
+
+        Returns:
+            tuple: (cached result or None if there is no valid entry,
+                validation key or None if the file could not be read)
+        """
+        try:
+            key = self._file_key(file_path)
+        except OSError:
+            return None, None
+        try:
+            with open(self._entry_path(file_path), 'rb') as file:
+                stored_key, result = _ResultUnpickler(file).load()
+            if stored_key == key:
+                return result, key
+        except FileNotFoundError:
+            pass
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, TypeError, ValueError):
+            # Corrupt entry or one written by an incompatible version: treat as a miss
+            pass
+        return None, key
+
+    def store(self, file_path: str, key: Optional[tuple], result: Any) -> None:
+        """Store the parse result of a file.
+
+        Failing to write the cache is not an error, the result is simply not cached.
+
+        Args:
+            file_path: Source file that was parsed
+            key: Validation key returned by load() before the file was parsed
+            result: Parse result to cache
+        """
+        if key is None:
+            return
+        entry_path = self._entry_path(file_path)
+        temp_path = f"{entry_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(temp_path, 'wb') as file:
+                pickle.dump((key, result), file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, entry_path)
+        except OSError:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
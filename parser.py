@@ -9,6 +9,7 @@ This module provides parsers for:
 """
 import re
 from datatypes import *
+from enums import ParameterType
 import dataclasses
 from typing import List, Union
 from pathlib import Path
@@ -18,16 +19,16 @@ import xml.etree.ElementTree as ET
 class Parser:
     """Base parser class with common parsing methods for B&R types."""
     
-    def parse_comment(self, text: str) -> Comment:
-        """Parse a comment string into a Comment object.
+    def parse_comment(self, text: str) -> str:
+        """Parse a comment string.
         
         Args:
             text: The comment text to parse.
             
         Returns:
-            Comment object with trimmed text.
+            Trimmed comment text.
         """
-        return Comment(text=text.strip())
+        return text.strip()
 
     def parse_array_dimension(self, dim_str: str) -> ArrayDimension:
         """Parse an array dimension string (e.g., '0..10' or 'MIN..MAX').
@@ -83,15 +84,16 @@ class Parser:
                 is_constant_upper=is_constant_upper
             )
         
-        return BasicType(type=type_str)
+        return BasicType.get(type_str)
 
-    def parse_variable_section(self, section: str, var_class, is_retain: bool = False) -> List[Variable]:
+    def parse_variable_section(self, section: str, kind: ParameterType = ParameterType.VAR, is_retain: bool = False, is_constant: bool = False) -> List[Variable]:
         """Parse a variable section and extract all variable declarations.
         
         Args:
             section: The section content to parse.
-            var_class: The variable class to instantiate (VarInput, VarOutput, etc.).
+            kind: The declaration section the variables belong to (IN, OUT, etc.).
             is_retain: Whether variables have RETAIN keyword.
+            is_constant: Whether variables are declared in a constant section.
             
         Returns:
             List of variable objects.
@@ -105,7 +107,7 @@ class Parser:
             name, redundancy_info, ref, type_str, default_value, comment1, comment2, comment3 = match.groups()
             is_reference = ref is not None
             parsed_type = self.parse_type(type_str.strip())
-            variables.append(var_class(
+            variables.append(Variable(
                 name=name, 
                 type=parsed_type, 
                 is_reference=is_reference, 
@@ -114,7 +116,9 @@ class Parser:
                 comment1=comment1, 
                 comment2=comment2, 
                 comment3=comment3,
-                retain=is_retain
+                retain=is_retain,
+                kind=kind,
+                is_constant=is_constant
             ))
         return variables
     
@@ -142,15 +146,15 @@ class FunctionBlockParser(Parser):
             section_type, retain_keyword, section_content = section_match.groups()
             is_retain = retain_keyword is not None
             if section_type == "_INPUT":
-                function_block.var_input.extend(self.parse_variable_section(section_content, VarInput, is_retain))
+                function_block.var_input.extend(self.parse_variable_section(section_content, ParameterType.IN, is_retain))
             elif section_type == "_OUTPUT":
-                function_block.var_output.extend(self.parse_variable_section(section_content, VarOutput, is_retain))
+                function_block.var_output.extend(self.parse_variable_section(section_content, ParameterType.OUT, is_retain))
             elif section_type == "_CONSTANT":
-                function_block.var_constant.extend(self.parse_variable_section(section_content, VarConstant, is_retain))
+                function_block.var_constant.extend(self.parse_variable_section(section_content, ParameterType.VAR, is_retain, is_constant=True))
             elif section_type == "_IN_OUT":
-                function_block.var_in_out.extend(self.parse_variable_section(section_content, VarInOut))
+                function_block.var_in_out.extend(self.parse_variable_section(section_content, ParameterType.IN_OUT))
             else:
-                function_block.var.extend(self.parse_variable_section(section_content, Var, is_retain))
+                function_block.var.extend(self.parse_variable_section(section_content, ParameterType.VAR, is_retain))
 
         return function_block
 
@@ -177,11 +181,11 @@ class FunctionParser(Parser):
         for section_match in var_section_pattern.finditer(content):
             section_type, section_content = section_match.groups()
             if section_type == "_INPUT":
-                function.var_input.extend(self.parse_variable_section(section_content, VarInput))
+                function.var_input.extend(self.parse_variable_section(section_content, ParameterType.IN))
             elif section_type == "_IN_OUT":
-                function.var_in_out.extend(self.parse_variable_section(section_content, VarInOut))
+                function.var_in_out.extend(self.parse_variable_section(section_content, ParameterType.IN_OUT))
             else:
-                function.var.extend(self.parse_variable_section(section_content, Var))
+                function.var.extend(self.parse_variable_section(section_content))
 
         return function
     
@@ -202,7 +206,7 @@ class StructureParser(Parser):
         structure = Structure(name=name, description=description.strip() if description else None)
         
         # Use parse_variable_section to parse the members
-        structure.members = self.parse_variable_section(members_content, Var)
+        structure.members = self.parse_variable_section(members_content)
 
         return structure
 
@@ -576,16 +580,16 @@ class VarFileParser(Parser):
     
     def __init__(self) -> None:
         """Initialize the variable file parser."""
-        self.constants: List[VarConstant] = []
+        self.constants: List[Variable] = []
     
-    def parse_var_file(self, file_path: str) -> List[VarConstant]:
+    def parse_var_file(self, file_path: str) -> List[Variable]:
         """Parse a .var file and extract all constants.
         
         Args:
             file_path: Path to the .var file
             
         Returns:
-            List of VarConstant objects
+            List of constant Variable objects
         """
         with open(file_path, 'r', encoding='utf-8', errors='ignore') as file:
             content = file.read()
@@ -596,7 +600,7 @@ class VarFileParser(Parser):
         var_constant_blocks = self.parse_var_constant_blocks(content)
         
         for block in var_constant_blocks:
-            self.constants.extend(self.parse_variable_section(block, VarConstant))
+            self.constants.extend(self.parse_variable_section(block, is_constant=True))
         
         return self.constants
     
@@ -617,11 +621,11 @@ class VarFileParser(Parser):
         
         return constant_blocks
     
-    def get_constants(self) -> List[VarConstant]:
+    def get_constants(self) -> List[Variable]:
         """Get the list of parsed constants.
         
         Returns:
-            List of VarConstant objects
+            List of constant Variable objects
         """
         return self.constants
 
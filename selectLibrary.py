@@ -7,14 +7,33 @@ from pathlib import Path
 import tkinter as tk
 from tkinter import filedialog
 import os
-from typing import Tuple
+import stat
+from typing import List, Optional, Tuple
 
 
-def is_valid_library(library_path: str) -> Tuple[bool, str]:
+def find_fun_files(library_path: str) -> List[str]:
+    """Return the names of the .fun files in the top level of a library folder.
+    
+    Args:
+        library_path: Path to the library folder.
+        
+    Returns:
+        Names of the .fun files, from a single directory scan.
+        
+    Raises:
+        OSError: If the folder cannot be read.
+    """
+    with os.scandir(library_path) as entries:
+        return [entry.name for entry in entries if entry.name.endswith('.fun')]
+
+
+def is_valid_library(library_path: str, library_stat: Optional[os.stat_result] = None) -> Tuple[bool, str]:
     """Check if the given path contains a valid B&R library.
     
     Args:
         library_path: Path to check for library validity.
+        library_stat: Optional os.stat() result of library_path already obtained by the caller.
+            When given, the path is not stat'ed again.
         
     Returns:
         Tuple of (is_valid, error_message):
@@ -24,16 +43,20 @@ def is_valid_library(library_path: str) -> Tuple[bool, str]:
     if not library_path or library_path == "":
         return False, "No folder selected"
     
-    path = Path(library_path)
-    if not path.exists():
-        return False, "Selected folder does not exist"
+    if library_stat is None:
+        try:
+            library_stat = os.stat(library_path)
+        except FileNotFoundError:
+            return False, "Selected folder does not exist"
+        except OSError as e:
+            return False, f"Error reading folder: {str(e)}"
     
-    if not path.is_dir():
+    if not stat.S_ISDIR(library_stat.st_mode):
         return False, "Selected path is not a folder"
     
     # Check for .fun file (required for B&R library)
     try:
-        fun_files = [f for f in os.listdir(library_path) if f.endswith('.fun')]
+        fun_files = find_fun_files(library_path)
     except PermissionError:
         return False, "Cannot access folder: Permission denied"
     except Exception as e:
@@ -1,8 +1,10 @@
 """Utility functions for path management, especially for PyInstaller bundled executables."""
 import sys
+from functools import cache
 from pathlib import Path
 
 
+@cache
 def get_resource_path(relative_path: str) -> Path:
     """Get the absolute path to a resource, works for dev and for PyInstaller bundles.
     
@@ -12,6 +14,8 @@ def get_resource_path(relative_path: str) -> Path:
     - PyInstaller --onefile mode (_MEIPASS temporary folder)
     - PyInstaller --onedir mode (relative to executable)
     
+    The base folder does not change at runtime, so results are cached per relative_path.
+    
     Args:
         relative_path: Path relative to the script/executable location (e.g., "css/style.css")
     